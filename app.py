@@ -1,10 +1,17 @@
 #!/usr/bin/env python3
 """Apple Music TUI — a modern terminal controller for Apple Music on macOS."""
 
+import json
+import os
+import queue
+import re
+import shutil
 import subprocess
 import time
 import threading
 from dataclasses import dataclass, field
+from difflib import SequenceMatcher
+from functools import lru_cache, wraps
 from typing import Optional
 
 from textual import on, work
@@ -25,66 +32,265 @@ from textual.widgets import (
     Input,
 )
 
+from applescript_runner import AppleScriptRunner
+
+try:
+    from AppKit import NSRunningApplication
+    from ApplicationServices import (
+        AXUIElementCopyAttributeValue,
+        AXUIElementCreateApplication,
+        kAXChildrenAttribute,
+        kAXErrorSuccess,
+        kAXRoleAttribute,
+        kAXValueAttribute,
+        kAXWindowsAttribute,
+    )
+    HAS_AX = True
+except ImportError:
+    HAS_AX = False
+
+try:
+    from ScriptingBridge import SBApplication
+except ImportError:
+    SBApplication = None
+
+# Subprocesses: every child is started with close_fds=False, which lets
+# subprocess use posix_spawn instead of fork+exec. That is safe as long as
+# every descriptor we open stays non-inheritable, which is the default for
+# os.pipe(), open() and subprocess's own pipes (PEP 446). Only the terminal
+# on fds 0-2 reaches the child.
+
 # ── Constants ─────────────────────────────────────────────────────────
 
 APP_NAME = "Music"
+MUSIC_BUNDLE_ID = "com.apple.Music"
 APPLESCRIPT_TIMEOUT = 5.0
 POLL_INTERVAL = 2.0
+SEARCH_DEBOUNCE = 0.08
+PROGRESS_WIDTH = 40
+CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "musictui")
+MUSIC_LIBRARY_DB = os.path.join(
+    os.path.expanduser("~"), "Music", "Music", "Music Library.musiclibrary", "Library.musicdb"
+)
+PLAYLIST_CACHE = os.path.join(CACHE_DIR, "playlists.json")
+# Optional push helper (musictui-nowplaying.swift, see README) that prints one
+# JSON object per now-playing change (same track keys as FETCH_ALL_JXA). While
+# it runs, polling only has to cover volume/shuffle/repeat/up-next, so it slows
+# to PUSH_POLL_INTERVAL; if it exits, polling returns to POLL_INTERVAL.
+NOWPLAYING_HELPER = os.environ.get("MUSICTUI_NOWPLAYING_HELPER", "musictui-nowplaying")
+PUSH_POLL_INTERVAL = 10.0
 
 # ── AppleScript helpers ──────────────────────────────────────────────
 
 
 def run_applescript(script: str, timeout: float = APPLESCRIPT_TIMEOUT) -> tuple[str, str, int]:
+    result = repl.evaluate(f"run script {applescript_quote(script)}", timeout)
+    if result is not None:
+        return result
+    return _run_osascript(["-e", script], timeout)
+
+
+def run_jxa(script: str, timeout: float = APPLESCRIPT_TIMEOUT) -> tuple[str, str, int]:
+    result = repl.evaluate(f'run script {applescript_quote(script)} in "JavaScript"', timeout)
+    if result is not None:
+        return result
+    return _run_osascript(["-l", "JavaScript", "-e", script], timeout)
+
+
+def _run_osascript(args: list[str], timeout: float) -> tuple[str, str, int]:
     proc = subprocess.Popen(
-        ["/usr/bin/osascript", "-e", script],
+        ["/usr/bin/osascript", *args],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        close_fds=False,  # see module note
     )
     try:
         out, err = proc.communicate(timeout=timeout)
-        return out.strip(), err.strip(), proc.returncode
+        # Decode by hand: output is short and usually there is no stderr at all.
+        text = out.rstrip(b"\n").decode("utf-8", "replace") if out else ""
+        error = err.decode("utf-8", "replace").strip() if err else ""
+        return text, error, proc.returncode
     except subprocess.TimeoutExpired:
         proc.kill()
         proc.wait()
         return "", "AppleScript timed out", -1
 
 
-def applescript_escape(value: str) -> str:
-    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-    return escaped.replace("\n", " ").replace("\r", " ")
+_QUOTE_TABLE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+@lru_cache(maxsize=256)
+def applescript_quote(value: str) -> str:
+    """Return `value` as an AppleScript string literal, keeping line breaks."""
+    return '"' + value.translate(_QUOTE_TABLE) + '"'
+
+
+repl = AppleScriptRunner()
+
+
+class CommandQueue:
+    """Runs player commands in order on one long-lived thread.
+
+    Key presses used to spawn a worker thread each, only to block on the same
+    osascript child one after another. Queuing them keeps presses ordered
+    (five quick volume bumps land as five steps) and avoids the thread churn.
+    """
+
+    def __init__(self) -> None:
+        self._jobs: queue.Queue = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+
+    def submit(self, fn, *args) -> None:
+        self._jobs.put((fn, args))
+
+    def _run(self) -> None:
+        while True:
+            job = self._jobs.get()
+            if job is None:
+                return
+            fn, args = job
+            try:
+                fn(*args)
+            except Exception:
+                # One failed command must not stop the ones queued behind it.
+                pass
+
+    def close(self) -> None:
+        if self._thread is not None:
+            self._jobs.put(None)
+            self._thread = None
+
+
+commands = CommandQueue()
+
+
+def player_command(method):
+    """Decorator: run an app method on the command thread instead of inline."""
+
+    @wraps(method)
+    def submit(self, *args) -> None:
+        commands.submit(method, self, *args)
+
+    return submit
+
+
+# Parameterized commands are compiled once per session and receive their
+# arguments through `on run argv`, so osascript skips the parse step and the
+# values never need escaping into the source.
+COMPILED_SOURCES = {
+    "set_volume": f'''
+    on run argv
+        tell application "{APP_NAME}" to set sound volume to (item 1 of argv as integer)
+    end run
+    ''',
+    "seek": f'''
+    on run argv
+        tell application "{APP_NAME}" to set player position to (item 1 of argv as real)
+    end run
+    ''',
+    "play_playlist": f'''
+    on run argv
+        tell application "{APP_NAME}" to play playlist (item 1 of argv)
+    end run
+    ''',
+}
+
+_compiled_paths: dict[str, str] = {}
+_compile_lock = threading.Lock()
+
+
+def compiled_script_path(name: str) -> str:
+    """Return the .scpt path for a COMPILED_SOURCES entry, or "" if osacompile failed."""
+    with _compile_lock:
+        if name in _compiled_paths:
+            return _compiled_paths[name]
+        path = os.path.join(CACHE_DIR, f"{name}.scpt")
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            proc = subprocess.run(
+                ["/usr/bin/osacompile", "-o", path, "-e", COMPILED_SOURCES[name]],
+                capture_output=True,
+                timeout=APPLESCRIPT_TIMEOUT,
+                close_fds=False,  # see module note
+            )
+            ok = proc.returncode == 0
+        except (OSError, subprocess.SubprocessError):
+            ok = False
+        _compiled_paths[name] = path if ok else ""
+        return _compiled_paths[name]
+
+
+def run_compiled(name: str, *args: str, timeout: float = APPLESCRIPT_TIMEOUT) -> tuple[str, str, int]:
+    path = compiled_script_path(name)
+    target = f"(POSIX file {applescript_quote(path)})" if path else applescript_quote(COMPILED_SOURCES[name])
+    params = ", ".join(applescript_quote(a) for a in args)
+    result = repl.evaluate(f"run script {target} with parameters {{{params}}}", timeout)
+    if result is not None:
+        return result
+    if path:
+        return _run_osascript([path, *args], timeout)
+    return _run_osascript(["-e", COMPILED_SOURCES[name], *args], timeout)
+
+
+_NUM_RE = re.compile(r"[-+]?\d*\.?\d+")
+_COMMA_TO_DOT = str.maketrans(",", ".")
+_DROP_COMMAS = str.maketrans("", "", ",")
 
 
 def parse_number(raw: str) -> float:
     if not raw:
         return 0.0
-    text = raw.strip()
-    if "," in text and "." not in text:
-        text = text.replace(",", ".")
+    if "," in raw and "." not in raw:
+        text = raw.translate(_COMMA_TO_DOT)
     else:
-        text = text.replace(",", "")
-    filtered = "".join(ch for ch in text if ch.isdigit() or ch in ".-")
-    if not filtered:
-        return 0.0
-    try:
-        return float(filtered)
-    except ValueError:
+        text = raw.translate(_DROP_COMMAS)
+    match = _NUM_RE.search(text)
+    if match is None:
         return 0.0
+    return float(match.group())
+
+
+def parse_shuffle(raw: str) -> Optional[bool]:
+    if raw == "true":
+        return True
+    if raw == "false":
+        return False
+    return None
+
+
+def parse_repeat(raw: str) -> Optional[str]:
+    low = raw.strip().lower()
+    if low in ("off", "none"):
+        return "off"
+    if low in ("one", "all"):
+        return low
+    return None
 
 
 def format_time(seconds: float) -> str:
     if seconds <= 0:
         return "0:00"
-    total = int(seconds)
+    return _format_seconds(int(seconds))
+
+
+@lru_cache(maxsize=256)
+def _format_seconds(total: int) -> str:
     m, s = divmod(total, 60)
     return f"{m}:{s:02d}"
 
 
+_AUTH_ERROR_RE = re.compile(r"not (?:authori[sz]ed|permitted)", re.IGNORECASE)
+
+
 def format_error(err: str) -> str:
     if not err:
         return ""
-    low = err.lower()
-    if "not authorized" in low or "not permitted" in low:
+    if _AUTH_ERROR_RE.search(err):
         return "Permission denied — enable Automation in System Settings > Privacy & Security"
     return err
 
@@ -116,32 +322,43 @@ class MusicState:
     _pre_mute_vol: int = 50
 
 
+@dataclass
+class PollResult:
+    """Everything a single poll tick reads from Music in one round-trip."""
+
+    track: TrackInfo = field(default_factory=TrackInfo)
+    volume: int = -1
+    shuffle: Optional[bool] = None
+    repeat_mode: Optional[str] = None
+    current_playlist: str = ""
+    up_next_name: str = ""
+    up_next_artist: str = ""
+
+
 # ── AppleScript commands ─────────────────────────────────────────────
 
 
-def fetch_now_playing() -> TrackInfo:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            if player state is stopped then return "STOPPED"
-            set t to current track
-            return name of t & "\\n" & artist of t & "\\n" & album of t & "\\n" & (player state as string) & "\\n" & duration of t & "\\n" & player position
-        end if
-    end tell
-    return "NOT_RUNNING"
-    '''
-    out, err, code = run_applescript(script)
-    if err or code != 0 or out in ("STOPPED", "NOT_RUNNING", ""):
-        return TrackInfo(state=out if out else "STOPPED")
-    parts = out.split("\n")
-    if len(parts) >= 6:
-        return TrackInfo(
-            name=parts[0], artist=parts[1], album=parts[2],
-            state=parts[3].upper(),
-            duration=parse_number(parts[4]),
-            position=parse_number(parts[5]),
-        )
-    return TrackInfo(state="STOPPED")
+def _fourcc(code: str) -> int:
+    return int.from_bytes(code.encode("ascii"), "big")
+
+
+# Music's `song repeat` enumeration codes, as ScriptingBridge expects them.
+REPEAT_CODES = {"off": _fourcc("kRpO"), "one": _fourcc("kRp1"), "all": _fourcc("kAll")}
+
+_bridge = None
+
+
+def music_bridge():
+    """Return a ScriptingBridge proxy for Music, or None without pyobjc.
+
+    Commands sent through it are plain AppleEvents from this process, so they
+    skip osascript entirely. The SBApplication itself is created lazily and
+    never launches Music on its own.
+    """
+    global _bridge
+    if _bridge is None and SBApplication is not None:
+        _bridge = SBApplication.applicationWithBundleIdentifier_(MUSIC_BUNDLE_ID)
+    return _bridge
 
 
 def fetch_playlists() -> list[str]:
@@ -158,64 +375,191 @@ def fetch_playlists() -> list[str]:
     return [p.strip() for p in out.split("\n") if p.strip()]
 
 
-def fetch_up_next_ui() -> tuple[str, str]:
-    script = f'''
-    tell application "System Events"
-        if not (exists process "{APP_NAME}") then return "NO"
-        tell process "{APP_NAME}"
-            if not (exists window 1) then return "NO"
-            try
-                set theTable to first table of scroll area 1 of window 1
-                set row1 to first row of theTable
-                set texts to value of static text of row1
-                if (count of texts) >= 2 then
-                    return item 1 of texts & "\\n" & item 2 of texts
-                else if (count of texts) = 1 then
-                    return item 1 of texts
-                end if
-            end try
-        end tell
-    end tell
-    return "NO"
-    '''
-    out, _, code = run_applescript(script)
-    if code != 0 or out in ("NO", ""):
-        return "", ""
-    parts = out.split("\n")
-    return parts[0] if parts else "", parts[1] if len(parts) > 1 else ""
+def load_playlists(force: bool = False) -> list[str]:
+    """Return playlist names, reusing the on-disk cache while the library file is unchanged.
+
+    ``force`` skips the cache (the explicit refresh key) and rewrites it.
+    """
+    try:
+        mtime = os.stat(MUSIC_LIBRARY_DB).st_mtime
+    except OSError:
+        return fetch_playlists()
+    if not force:
+        try:
+            with open(PLAYLIST_CACHE, encoding="utf-8") as handle:
+                cached = json.load(handle)
+            if cached.get("mtime") == mtime and isinstance(cached.get("playlists"), list):
+                return cached["playlists"]
+        except (OSError, ValueError, AttributeError):
+            pass
+    playlists = fetch_playlists()
+    if playlists:
+        tmp = PLAYLIST_CACHE + ".tmp"
+        try:
+            os.makedirs(CACHE_DIR, exist_ok=True)
+            with open(tmp, "w", encoding="utf-8") as handle:
+                json.dump({"mtime": mtime, "playlists": playlists}, handle)
+            os.replace(tmp, PLAYLIST_CACHE)
+        except OSError:
+            pass
+    return playlists
+
+
+# One JXA pass builds the whole poll payload as a JS object and returns it as
+# JSON, so Python only needs json.loads instead of splitting and number parsing.
+# READ_UP_NEXT is false when the accessibility API already supplied up-next.
+_FETCH_ALL_JXA_BODY = """
+(() => {
+    const music = Application(APP_NAME);
+    if (!music.running()) return "NOT_RUNNING";
+    const attempt = (fn, fallback) => { try { return fn(); } catch (e) { return fallback; } };
+    const out = {
+        name: "", artist: "", album: "", state: String(music.playerState()),
+        duration: 0, position: 0, volume: -1, repeat: "", shuffle: null,
+        playlist: "", upNextName: "", upNextArtist: "",
+    };
+    const stopped = out.state === "stopped";
+    if (!stopped) {
+        const t = music.currentTrack;
+        out.name = attempt(() => t.name(), "");
+        out.artist = attempt(() => t.artist(), "");
+        out.album = attempt(() => t.album(), "");
+        out.duration = attempt(() => t.duration(), 0);
+        out.position = attempt(() => music.playerPosition(), 0);
+        out.playlist = attempt(() => music.currentPlaylist.name(), "");
+    }
+    out.volume = attempt(() => music.soundVolume(), -1);
+    out.repeat = String(attempt(() => music.songRepeat(), ""));
+    out.shuffle = attempt(() => music.currentPlaylist.shuffleEnabled(),
+                          attempt(() => music.shuffleEnabled(), null));
+    if (READ_UP_NEXT) attempt(() => {
+        const row = Application("System Events").processes.byName(APP_NAME)
+            .windows[0].scrollAreas[0].tables[0].rows[0];
+        const texts = row.staticTexts.value();
+        out.upNextName = String(texts[0] || "");
+        out.upNextArtist = String(texts[1] || "");
+    });
+    if (READ_UP_NEXT && !out.upNextName && !stopped) {
+        attempt(() => {
+            // index is 1-based, so tracks[index] is the one after it.
+            const tracks = music.currentPlaylist.tracks;
+            const i = music.currentTrack.index();
+            if (i > 0 && i < tracks.length) {
+                out.upNextName = tracks[i].name();
+                out.upNextArtist = tracks[i].artist();
+            }
+        });
+    }
+    return JSON.stringify(out);
+})()
+"""
+FETCH_ALL_JXA = {
+    read_up_next: (
+        f"const APP_NAME = {json.dumps(APP_NAME)};\n"
+        f"const READ_UP_NEXT = {json.dumps(read_up_next)};\n" + _FETCH_ALL_JXA_BODY
+    )
+    for read_up_next in (True, False)
+}
 
 
-def fetch_up_next_playlist() -> tuple[str, str]:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            if player state is stopped then return "NO"
-            try
-                set cp to current playlist
-                set ct to current track
-                set pid to persistent ID of ct
-                set tl to tracks of cp
-                repeat with i from 1 to count of tl
-                    if persistent ID of item i of tl is pid then
-                        if i < count of tl then
-                            set nt to item (i + 1) of tl
-                            return name of nt & "\\n" & artist of nt
-                        end if
-                    end if
-                end repeat
-            end try
-        end if
-    end tell
-    return "NO"
-    '''
-    out, _, code = run_applescript(script)
-    if code != 0 or out in ("NO", ""):
-        return "", ""
-    parts = out.split("\n")
-    return parts[0] if parts else "", parts[1] if len(parts) > 1 else ""
+def _ax_attr(element, attribute):
+    err, value = AXUIElementCopyAttributeValue(element, attribute, None)
+    return value if err == kAXErrorSuccess else None
+
+
+def _ax_first_child(element, role: str):
+    for child in _ax_attr(element, kAXChildrenAttribute) or ():
+        if _ax_attr(child, kAXRoleAttribute) == role:
+            return child
+    return None
+
+
+def fetch_up_next_ax() -> Optional[tuple[str, str]]:
+    """Read the first up-next row straight from Music's accessibility tree.
+
+    Walks the same path as the System Events script (window 1 → scroll area →
+    table → first row → static texts) in-process. Returns None whenever any
+    step fails so the caller can fall back to the scripted lookup.
+    """
+    if not HAS_AX:
+        return None
+    apps = NSRunningApplication.runningApplicationsWithBundleIdentifier_(MUSIC_BUNDLE_ID)
+    if not apps:
+        return None
+    element = AXUIElementCreateApplication(apps[0].processIdentifier())
+    windows = _ax_attr(element, kAXWindowsAttribute)
+    if not windows:
+        return None
+    element = windows[0]
+    for role in ("AXScrollArea", "AXTable", "AXRow"):
+        element = _ax_first_child(element, role)
+        if element is None:
+            return None
+    texts = [
+        str(_ax_attr(child, kAXValueAttribute) or "")
+        for child in _ax_attr(element, kAXChildrenAttribute) or ()
+        if _ax_attr(child, kAXRoleAttribute) == "AXStaticText"
+    ]
+    if not texts or not texts[0]:
+        return None
+    return texts[0], texts[1] if len(texts) > 1 else ""
+
+
+def track_from_json(data: dict) -> TrackInfo:
+    """Build a TrackInfo from the track keys shared by the JXA poll and the push helper."""
+    state = str(data.get("state", "")).upper()
+    if state in ("STOPPED", ""):
+        return TrackInfo(state="STOPPED")
+    return TrackInfo(
+        name=data.get("name") or "", artist=data.get("artist") or "",
+        album=data.get("album") or "",
+        state=state,
+        duration=float(data.get("duration") or 0.0),
+        position=float(data.get("position") or 0.0),
+    )
+
+
+def fetch_all_state() -> PollResult:
+    """Read track, volume, shuffle, repeat, playlist and up-next in one osascript call."""
+    ax_up_next = fetch_up_next_ax()
+    out, err, code = run_jxa(FETCH_ALL_JXA[ax_up_next is None])
+    if err or code != 0 or out in ("NOT_RUNNING", ""):
+        return PollResult(track=TrackInfo(state=out if out else "STOPPED"))
+    try:
+        data = json.loads(out)
+    except ValueError:
+        return PollResult()
+    volume = data.get("volume")
+    shuffle = data.get("shuffle")
+    return PollResult(
+        track=track_from_json(data),
+        volume=int(volume) if isinstance(volume, (int, float)) else -1,
+        repeat_mode=parse_repeat(str(data.get("repeat") or "")),
+        shuffle=shuffle if isinstance(shuffle, bool) else None,
+        current_playlist=(data.get("playlist") or "").strip(),
+        up_next_name=ax_up_next[0] if ax_up_next else data.get("upNextName") or "",
+        up_next_artist=ax_up_next[1] if ax_up_next else data.get("upNextArtist") or "",
+    )
+
+
+def _shuffle_owner(music):
+    """Whose shuffle flag to use: the current playlist if any, else the app.
+
+    Same order as the JXA poll and the AppleScript paths, so a toggle always
+    flips the flag the UI shows.
+    """
+    playlist = music.currentPlaylist()
+    if playlist is not None and playlist.exists():
+        return playlist
+    return music
 
 
 def fetch_shuffle() -> Optional[bool]:
+    music = music_bridge()
+    if music is not None:
+        if not music.isRunning():
+            return None
+        return bool(_shuffle_owner(music).shuffleEnabled())
     script = f'''
     tell application "{APP_NAME}"
         if it is running then
@@ -234,38 +578,13 @@ def fetch_shuffle() -> Optional[bool]:
     out, _, code = run_applescript(script)
     if code != 0:
         return None
-    if out == "true":
-        return True
-    if out == "false":
-        return False
-    return None
-
-
-def fetch_repeat() -> Optional[str]:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            try
-                return song repeat as string
-            end try
-        end if
-    end tell
-    return "UNKNOWN"
-    '''
-    out, _, code = run_applescript(script)
-    if code != 0:
-        return None
-    low = out.strip().lower()
-    if low in ("off", "none"):
-        return "off"
-    if low == "one":
-        return "one"
-    if low == "all":
-        return "all"
-    return None
+    return parse_shuffle(out)
 
 
 def fetch_volume() -> int:
+    music = music_bridge()
+    if music is not None:
+        return int(music.soundVolume()) if music.isRunning() else -1
     script = f'''
     tell application "{APP_NAME}"
         if it is running then return sound volume as string
@@ -281,53 +600,70 @@ def fetch_volume() -> int:
         return -1
 
 
-def fetch_current_playlist() -> str:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            if player state is not stopped then
-                try
-                    return name of current playlist
-                end try
-            end if
-        end if
-    end tell
-    return ""
-    '''
-    out, _, code = run_applescript(script)
-    return out.strip() if code == 0 else ""
-
-
 def cmd_play_pause():
+    music = music_bridge()
+    if music is not None:
+        music.playpause()
+        return
     run_applescript(f'tell application "{APP_NAME}" to playpause')
 
 
 def cmd_next():
+    music = music_bridge()
+    if music is not None:
+        music.nextTrack()
+        return
     run_applescript(f'tell application "{APP_NAME}" to next track')
 
 
 def cmd_prev():
+    music = music_bridge()
+    if music is not None:
+        music.previousTrack()
+        return
     run_applescript(f'tell application "{APP_NAME}" to previous track')
 
 
 def cmd_stop():
+    music = music_bridge()
+    if music is not None:
+        music.stop()
+        return
     run_applescript(f'tell application "{APP_NAME}" to stop')
 
 
 def cmd_play_playlist(name: str):
-    safe = applescript_escape(name)
-    run_applescript(f'tell application "{APP_NAME}" to play playlist "{safe}"')
+    music = music_bridge()
+    if music is not None:
+        music.playlists().objectWithName_(name).playOnce_(False)
+        return
+    run_compiled("play_playlist", name)
 
 
 def cmd_set_volume(vol: int):
-    run_applescript(f'tell application "{APP_NAME}" to set sound volume to {vol}')
+    music = music_bridge()
+    if music is not None:
+        music.setSoundVolume_(vol)
+        return
+    run_compiled("set_volume", str(vol))
 
 
 def cmd_seek(pos: float):
-    run_applescript(f'tell application "{APP_NAME}" to set player position to {pos}')
+    music = music_bridge()
+    if music is not None:
+        music.setPlayerPosition_(pos)
+        return
+    # Whole seconds keep the text->real coercion independent of the decimal separator.
+    run_compiled("seek", str(round(pos)))
 
 
 def cmd_toggle_shuffle():
+    music = music_bridge()
+    if music is not None:
+        if music.isRunning():
+            owner = _shuffle_owner(music)
+            owner.setShuffleEnabled_(not owner.shuffleEnabled())
+        return
     script = f'''
     tell application "{APP_NAME}"
         if it is running then
@@ -346,12 +682,23 @@ def cmd_toggle_shuffle():
 
 
 def cmd_set_repeat(mode: str):
+    music = music_bridge()
+    if music is not None:
+        music.setSongRepeat_(REPEAT_CODES[mode])
+        return
     run_applescript(f'tell application "{APP_NAME}" to set song repeat to {mode}')
 
 
 # ── Widgets ──────────────────────────────────────────────────────────
 
 
+STATE_LABELS = {
+    "PLAYING": "[green]▶ Playing[/]",
+    "PAUSED": "[yellow]⏸ Paused[/]",
+}
+STATUS_ICONS = {"PLAYING": "▶", "PAUSED": "⏸"}
+
+
 class NowPlaying(Static):
     """Displays the currently playing track info."""
 
@@ -362,13 +709,14 @@ class NowPlaying(Static):
         if t.state in ("NOT_RUNNING", "STOPPED", "UNKNOWN", ""):
             return "[dim]Nothing playing[/dim]"
 
-        state_icon = {"PLAYING": "▶", "PAUSED": "⏸"}.get(t.state, "⏹")
-        state_color = {"PLAYING": "green", "PAUSED": "yellow"}.get(t.state, "white")
+        label = STATE_LABELS.get(t.state)
+        if label is None:
+            label = f"[white]⏹ {t.state.capitalize()}[/]"
 
         lines = []
         lines.append(f"[bold white]{t.name or 'Untitled'}[/]")
         lines.append(f"[dim]{t.artist or 'Unknown'}  ·  {t.album or 'Unknown'}[/]")
-        lines.append(f"[{state_color}]{state_icon} {t.state.capitalize()}[/]")
+        lines.append(label)
         return "\n".join(lines)
 
 
@@ -378,18 +726,45 @@ class TrackProgress(Static):
     position: reactive[float] = reactive(0.0)
     duration: reactive[float] = reactive(0.0)
 
+    # Every possible bar, indexed by the number of filled cells.
+    _BARS = [
+        "[bold cyan]━[/]" * f + "[dim]╌[/]" * (PROGRESS_WIDTH - f)
+        for f in range(PROGRESS_WIDTH + 1)
+    ]
+
     def render(self) -> str:
         if self.duration <= 0:
             return "[dim]─── no track ───[/dim]"
         ratio = max(0.0, min(1.0, self.position / self.duration))
-        width = 40
-        filled = int(ratio * width)
-        bar = "[bold cyan]━[/]" * filled + "[dim]╌[/]" * (width - filled)
+        bar = self._BARS[int(ratio * PROGRESS_WIDTH)]
         pos_str = format_time(self.position)
         dur_str = format_time(self.duration)
         return f"  {pos_str}  {bar}  {dur_str}"
 
 
+SHUFFLE_CHIPS = {
+    True: "[bold green]⇆ Shuffle[/]",
+    False: "[dim]⇆ Shuffle[/]",
+    None: "[dim]⇆ ─[/]",
+}
+REPEAT_CHIPS = {
+    "all": "[bold green]↻ All[/]",
+    "one": "[bold yellow]↻ One[/]",
+    "off": "[dim]↻ Off[/]",
+}
+
+
+@lru_cache(maxsize=128)
+def volume_chip(volume: int) -> str:
+    if volume == 0:
+        return f"[bold red]🔇 {volume}%[/]"
+    if volume < 30:
+        return f"[dim]♪ {volume}%[/]"
+    if volume < 70:
+        return f"♪ {volume}%"
+    return f"[bold]♪ {volume}%[/]"
+
+
 class PlayerControls(Static):
     """Shows shuffle, repeat, volume status chips."""
 
@@ -398,37 +773,13 @@ class PlayerControls(Static):
     volume: reactive[int] = reactive(-1)
 
     def render(self) -> str:
-        parts = []
-
-        # Shuffle
-        if self.shuffle is True:
-            parts.append("[bold green]⇆ Shuffle[/]")
-        elif self.shuffle is False:
-            parts.append("[dim]⇆ Shuffle[/]")
-        else:
-            parts.append("[dim]⇆ ─[/]")
-
-        # Repeat
-        rpt = self.repeat_mode or "off"
-        if rpt == "all":
-            parts.append("[bold green]↻ All[/]")
-        elif rpt == "one":
-            parts.append("[bold yellow]↻ One[/]")
-        else:
-            parts.append("[dim]↻ Off[/]")
-
-        # Volume
+        chips = [
+            SHUFFLE_CHIPS.get(self.shuffle, SHUFFLE_CHIPS[None]),
+            REPEAT_CHIPS.get(self.repeat_mode, REPEAT_CHIPS["off"]),
+        ]
         if self.volume >= 0:
-            if self.volume == 0:
-                parts.append(f"[bold red]🔇 {self.volume}%[/]")
-            elif self.volume < 30:
-                parts.append(f"[dim]♪ {self.volume}%[/]")
-            elif self.volume < 70:
-                parts.append(f"♪ {self.volume}%")
-            else:
-                parts.append(f"[bold]♪ {self.volume}%[/]")
-
-        return "    ".join(parts)
+            chips.append(volume_chip(self.volume))
+        return "    ".join(chips)
 
 
 class UpNextPanel(Static):
@@ -466,11 +817,25 @@ class PlaylistItem(ListItem):
         self.playlist_name = name
         self.is_current = is_current
 
+    def _label_text(self) -> str:
+        return f"♫ {self.playlist_name}" if self.is_current else f"  {self.playlist_name}"
+
     def compose(self) -> ComposeResult:
         if self.is_current:
-            yield Label(f"♫ {self.playlist_name}", classes="playlist-playing")
+            yield Label(self._label_text(), classes="playlist-playing")
         else:
-            yield Label(f"  {self.playlist_name}")
+            yield Label(self._label_text())
+
+    def set_current(self, is_current: bool) -> None:
+        if is_current == self.is_current:
+            return
+        self.is_current = is_current
+        try:
+            label = self.query_one(Label)
+        except NoMatches:
+            return
+        label.update(self._label_text())
+        label.set_class(is_current, "playlist-playing")
 
 
 # ── Main App ─────────────────────────────────────────────────────────
@@ -597,8 +962,17 @@ class MusicTUI(App):
         self.music = MusicState()
         self._search_visible = False
         self._all_playlists: list[str] = []
+        self._playlists_lower: list[str] = []
+        self._last_query = ""
+        self._last_matches: list[int] = []
+        self._search_timer: Optional[Timer] = None
+        self._shown_names: list[str] = []
+        self._shown_items: list[PlaylistItem] = []
         self._poll_timer: Optional[Timer] = None
         self._tick_timer: Optional[Timer] = None
+        self._helper: Optional[subprocess.Popen] = None
+        repl.start()
+        commands.start()
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -629,147 +1003,246 @@ class MusicTUI(App):
         yield Footer()
 
     def on_mount(self) -> None:
+        self._w_np = self.query_one("#now-playing-box", NowPlaying)
+        self._w_pb = self.query_one("#progress-bar", TrackProgress)
+        self._w_ctrl = self.query_one("#controls", PlayerControls)
+        self._w_upnext = self.query_one("#up-next", UpNextPanel)
+        self._w_status = self.query_one("#status-bar", Static)
+        self._w_list = self.query_one("#playlist-list", ListView)
+        self._w_search = self.query_one("#playlist-search", Input)
         self._set_status("Loading...")
         self.initial_load()
+        interval = POLL_INTERVAL
+        if self._start_now_playing_helper():
+            interval = PUSH_POLL_INTERVAL
+            self.watch_now_playing(self._helper)
+        self._poll_timer = self.set_interval(interval, self.poll_state)
+
+    def on_unmount(self) -> None:
+        helper, self._helper = self._helper, None
+        if helper is not None:
+            helper.terminate()
+        commands.close()
+        repl.close()
+
+    def _start_now_playing_helper(self) -> bool:
+        path = shutil.which(NOWPLAYING_HELPER) if NOWPLAYING_HELPER else None
+        if not path:
+            return False
+        try:
+            self._helper = subprocess.Popen(
+                [path],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                close_fds=False,  # see module note
+            )
+        except OSError:
+            self._helper = None
+            return False
+        return True
+
+    @work(thread=True)
+    def watch_now_playing(self, proc: subprocess.Popen) -> None:
+        for line in proc.stdout:
+            try:
+                data = json.loads(line)
+            except ValueError:
+                continue
+            if not isinstance(data, dict):
+                continue
+            self.music.track = track_from_json(data)
+            self.music.last_position_time = time.monotonic()
+            self.call_from_thread(self._update_all_widgets)
+        # EOF: the helper died (on_unmount clears _helper before stopping it).
+        if self._helper is proc:
+            self.call_from_thread(self._resume_polling)
+
+    def _resume_polling(self) -> None:
+        """The push helper went away; poll at the normal rate again."""
+        self._helper = None
+        if self._poll_timer is not None:
+            self._poll_timer.stop()
         self._poll_timer = self.set_interval(POLL_INTERVAL, self.poll_state)
-        self._tick_timer = self.set_interval(0.5, self.tick_progress)
+        self.poll_state()
 
     @work(thread=True)
     def initial_load(self) -> None:
-        playlists = fetch_playlists()
-        track = fetch_now_playing()
-        vol = fetch_volume()
-        shuf = fetch_shuffle()
-        rpt = fetch_repeat()
-        cp = fetch_current_playlist()
-        un, ua = fetch_up_next_ui()
-        if not un:
-            un, ua = fetch_up_next_playlist()
-
+        playlists = load_playlists()
+        self._apply_poll(fetch_all_state())
         self.music.playlists = playlists
-        self.music.track = track
-        self.music.volume = vol
-        self.music.shuffle = shuf
-        self.music.repeat_mode = rpt
-        self.music.current_playlist = cp
-        self.music.up_next_name = un
-        self.music.up_next_artist = ua
-        self.music.last_position_time = time.time()
-        self._all_playlists = list(playlists)
+        self._set_all_playlists(playlists)
 
+        cp = self.music.current_playlist
         self.call_from_thread(self._update_all_widgets)
         self.call_from_thread(self._rebuild_playlist_list, playlists, cp)
         self.call_from_thread(self._set_status, f"Loaded {len(playlists)} playlists")
 
     @work(thread=True)
     def poll_state(self) -> None:
-        track = fetch_now_playing()
-        vol = fetch_volume()
-        shuf = fetch_shuffle()
-        rpt = fetch_repeat()
-        cp = fetch_current_playlist()
-        un, ua = fetch_up_next_ui()
-        if not un:
-            un, ua = fetch_up_next_playlist()
-
-        self.music.track = track
-        self.music.volume = vol
-        self.music.shuffle = shuf
-        self.music.repeat_mode = rpt
-        self.music.current_playlist = cp
-        self.music.up_next_name = un
-        self.music.up_next_artist = ua
-        self.music.last_position_time = time.time()
+        res = fetch_all_state()
+        changed = self._poll_changed(res)
+        self._apply_poll(res)
+        if changed:
+            self.call_from_thread(self._update_all_widgets)
+
+    def _poll_changed(self, res: PollResult) -> bool:
+        m = self.music
+        old, new = m.track, res.track
+        if (new.name, new.artist, new.album, new.state, new.duration) != (
+            old.name, old.artist, old.album, old.state, old.duration
+        ):
+            return True
+        # While playing, tick_progress picks up the fresh position on its own.
+        if new.state != "PLAYING" and new.position != old.position:
+            return True
+        return (
+            res.volume != m.volume
+            or res.shuffle != m.shuffle
+            or res.repeat_mode != m.repeat_mode
+            or res.current_playlist != m.current_playlist
+            or res.up_next_name != m.up_next_name
+            or res.up_next_artist != m.up_next_artist
+        )
 
-        self.call_from_thread(self._update_all_widgets)
+    def _apply_poll(self, res: PollResult) -> None:
+        self.music.track = res.track
+        self.music.volume = res.volume
+        self.music.shuffle = res.shuffle
+        self.music.repeat_mode = res.repeat_mode
+        self.music.current_playlist = res.current_playlist
+        self.music.up_next_name = res.up_next_name
+        self.music.up_next_artist = res.up_next_artist
+        self.music.last_position_time = time.monotonic()
+
+    def _sync_tick_timer(self, state: str) -> None:
+        # Only extrapolate the position while something is actually playing.
+        if state == "PLAYING":
+            if self._tick_timer is None:
+                self._tick_timer = self.set_interval(0.5, self.tick_progress)
+        elif self._tick_timer is not None:
+            self._tick_timer.stop()
+            self._tick_timer = None
 
     def tick_progress(self) -> None:
         t = self.music.track
-        if t.state == "PLAYING" and t.duration > 0:
-            now = time.time()
-            if self.music.last_position_time:
-                delta = now - self.music.last_position_time
-                t.position = min(t.duration, t.position + delta)
-            self.music.last_position_time = now
-            try:
-                pb = self.query_one("#progress-bar", TrackProgress)
-                pb.position = t.position
-                pb.duration = t.duration
-            except NoMatches:
-                pass
+        if t.state != "PLAYING" or t.duration <= 0:
+            return
+        m = self.music
+        now = time.monotonic()
+        if m.last_position_time:
+            delta = max(0.0, now - m.last_position_time)
+            t.position = min(t.duration, t.position + delta)
+        m.last_position_time = now
+        pb = self._w_pb
+        # The bar only shows whole seconds; skip the refresh until one ticks over.
+        if int(t.position) == int(pb.position):
+            return
+        pb.position = t.position
 
     def _update_all_widgets(self) -> None:
         t = self.music.track
-        try:
-            np = self.query_one("#now-playing-box", NowPlaying)
-            np.track = t
-        except NoMatches:
-            pass
-
-        try:
-            pb = self.query_one("#progress-bar", TrackProgress)
-            pb.position = t.position
-            pb.duration = t.duration
-        except NoMatches:
-            pass
-
-        try:
-            ctrl = self.query_one("#controls", PlayerControls)
-            ctrl.shuffle = self.music.shuffle
-            ctrl.repeat_mode = self.music.repeat_mode
-            ctrl.volume = self.music.volume
-        except NoMatches:
-            pass
+        m = self.music
+        np, pb, ctrl, un = self._w_np, self._w_pb, self._w_ctrl, self._w_upnext
+        self._sync_tick_timer(t.state)
+        with self.batch_update():
+            if np.track != t:
+                np.track = t
+            if pb.position != t.position:
+                pb.position = t.position
+            if pb.duration != t.duration:
+                pb.duration = t.duration
+            if ctrl.shuffle != m.shuffle:
+                ctrl.shuffle = m.shuffle
+            if ctrl.repeat_mode != m.repeat_mode:
+                ctrl.repeat_mode = m.repeat_mode
+            if ctrl.volume != m.volume:
+                ctrl.volume = m.volume
+            if un.up_next_name != m.up_next_name:
+                un.up_next_name = m.up_next_name
+            if un.up_next_artist != m.up_next_artist:
+                un.up_next_artist = m.up_next_artist
+            if un.current_playlist != m.current_playlist:
+                un.current_playlist = m.current_playlist
+
+    def _set_all_playlists(self, playlists: list[str]) -> None:
+        self._all_playlists = list(playlists)
+        self._playlists_lower = [p.lower() for p in self._all_playlists]
+        self._last_query = ""
+        self._last_matches = []
 
-        try:
-            un = self.query_one("#up-next", UpNextPanel)
-            un.up_next_name = self.music.up_next_name
-            un.up_next_artist = self.music.up_next_artist
-            un.current_playlist = self.music.current_playlist
-        except NoMatches:
-            pass
+    def _filter_playlists(self, query: str) -> list[str]:
+        if not query:
+            return self._all_playlists
+        lower = self._playlists_lower
+        # Typing extends the query, so only the previous matches can still match.
+        if self._last_query and query.startswith(self._last_query):
+            candidates = self._last_matches
+        else:
+            candidates = range(len(lower))
+        matches = [i for i in candidates if query in lower[i]]
+        self._last_query = query
+        self._last_matches = matches
+        names = self._all_playlists
+        return [names[i] for i in matches]
 
     def _rebuild_playlist_list(self, playlists: list[str], current: str = "") -> None:
-        try:
-            lv = self.query_one("#playlist-list", ListView)
-        except NoMatches:
-            return
-        lv.clear()
-        for name in playlists:
-            lv.append(PlaylistItem(name, is_current=(name == current and bool(current))))
+        lv = self._w_list
+        # Remove and mount only the rows that differ from what is on screen;
+        # rows kept in place just get their "now playing" marker refreshed.
+        old_names, old_items = self._shown_names, self._shown_items
+        new_items: list[PlaylistItem] = []
+        matcher = SequenceMatcher(None, old_names, playlists, autojunk=False)
+        for tag, i1, i2, j1, j2 in matcher.get_opcodes():
+            if tag == "equal":
+                for item in old_items[i1:i2]:
+                    item.set_current(item.playlist_name == current and bool(current))
+                new_items.extend(old_items[i1:i2])
+                continue
+            for item in old_items[i1:i2]:
+                item.remove()
+            fresh = [PlaylistItem(name, is_current=(name == current and bool(current)))
+                     for name in playlists[j1:j2]]
+            if fresh:
+                # The next opcode is always "equal", so old_items[i2] is kept.
+                if i2 < len(old_items):
+                    lv.mount(*fresh, before=old_items[i2])
+                else:
+                    lv.mount(*fresh)
+                new_items.extend(fresh)
+        self._shown_names = list(playlists)
+        self._shown_items = new_items
+        if new_items and lv.index is None:
+            lv.index = 0
 
     def _set_status(self, msg: str) -> None:
-        try:
-            sb = self.query_one("#status-bar", Static)
-            t = self.music.track
-            icon = {"PLAYING": "▶", "PAUSED": "⏸"}.get(t.state, "·")
-            sb.update(f" {icon}  {msg}")
-        except NoMatches:
-            pass
+        icon = STATUS_ICONS.get(self.music.track.state, "·")
+        self._w_status.update(f" {icon}  {msg}")
 
     # ── Actions ───────────────────────────────────────────────────────
 
-    @work(thread=True)
+    @player_command
     def action_play_pause(self) -> None:
         cmd_play_pause()
         self.call_from_thread(self._set_status, "Toggled play/pause")
 
-    @work(thread=True)
+    @player_command
     def action_next_track(self) -> None:
         cmd_next()
         self.call_from_thread(self._set_status, "Next track")
 
-    @work(thread=True)
+    @player_command
     def action_prev_track(self) -> None:
         cmd_prev()
         self.call_from_thread(self._set_status, "Previous track")
 
-    @work(thread=True)
+    @player_command
     def action_stop_track(self) -> None:
         cmd_stop()
         self.call_from_thread(self._set_status, "Stopped")
 
-    @work(thread=True)
+    @player_command
     def action_toggle_shuffle(self) -> None:
         cmd_toggle_shuffle()
         self.music.shuffle = fetch_shuffle()
@@ -777,7 +1250,7 @@ class MusicTUI(App):
         state = "on" if self.music.shuffle else "off"
         self.call_from_thread(self._set_status, f"Shuffle {state}")
 
-    @work(thread=True)
+    @player_command
     def action_toggle_repeat(self) -> None:
         cycle = {"off": "all", "all": "one", "one": "off"}
         current = self.music.repeat_mode or "off"
@@ -787,7 +1260,7 @@ class MusicTUI(App):
         self.call_from_thread(self._update_all_widgets)
         self.call_from_thread(self._set_status, f"Repeat: {next_mode}")
 
-    @work(thread=True)
+    @player_command
     def action_volume_up(self) -> None:
         if self.music.volume < 0:
             self.music.volume = fetch_volume()
@@ -797,7 +1270,7 @@ class MusicTUI(App):
         self.call_from_thread(self._update_all_widgets)
         self.call_from_thread(self._set_status, f"Volume: {new}%")
 
-    @work(thread=True)
+    @player_command
     def action_volume_down(self) -> None:
         if self.music.volume < 0:
             self.music.volume = fetch_volume()
@@ -807,7 +1280,7 @@ class MusicTUI(App):
         self.call_from_thread(self._update_all_widgets)
         self.call_from_thread(self._set_status, f"Volume: {new}%")
 
-    @work(thread=True)
+    @player_command
     def action_toggle_mute(self) -> None:
         if self.music.volume < 0:
             self.music.volume = fetch_volume()
@@ -822,7 +1295,7 @@ class MusicTUI(App):
         msg = "Muted" if new == 0 else f"Unmuted ({new}%)"
         self.call_from_thread(self._set_status, msg)
 
-    @work(thread=True)
+    @player_command
     def action_seek_forward(self) -> None:
         t = self.music.track
         if t.state not in ("PLAYING", "PAUSED"):
@@ -830,11 +1303,11 @@ class MusicTUI(App):
         new_pos = min(t.duration, t.position + 10.0)
         cmd_seek(new_pos)
         t.position = new_pos
-        self.music.last_position_time = time.time()
+        self.music.last_position_time = time.monotonic()
         self.call_from_thread(self._update_all_widgets)
         self.call_from_thread(self._set_status, "Seek forward 10s")
 
-    @work(thread=True)
+    @player_command
     def action_seek_back(self) -> None:
         t = self.music.track
         if t.state not in ("PLAYING", "PAUSED"):
@@ -842,18 +1315,25 @@ class MusicTUI(App):
         new_pos = max(0.0, t.position - 10.0)
         cmd_seek(new_pos)
         t.position = new_pos
-        self.music.last_position_time = time.time()
+        self.music.last_position_time = time.monotonic()
         self.call_from_thread(self._update_all_widgets)
         self.call_from_thread(self._set_status, "Seek back 10s")
 
+    def _close_search(self) -> None:
+        if self._search_timer is not None:
+            self._search_timer.stop()
+            self._search_timer = None
+        self._search_visible = False
+        search_input = self._w_search
+        search_input.remove_class("visible")
+        search_input.value = ""
+        self._rebuild_playlist_list(self._all_playlists, self.music.current_playlist)
+        self._w_list.focus()
+
     def action_search(self) -> None:
-        search_input = self.query_one("#playlist-search", Input)
+        search_input = self._w_search
         if self._search_visible:
-            self._search_visible = False
-            search_input.remove_class("visible")
-            search_input.value = ""
-            self._rebuild_playlist_list(self._all_playlists, self.music.current_playlist)
-            self.query_one("#playlist-list", ListView).focus()
+            self._close_search()
         else:
             self._search_visible = True
             search_input.add_class("visible")
@@ -861,9 +1341,9 @@ class MusicTUI(App):
 
     @work(thread=True)
     def action_refresh(self) -> None:
-        playlists = fetch_playlists()
+        playlists = load_playlists(force=True)
         self.music.playlists = playlists
-        self._all_playlists = list(playlists)
+        self._set_all_playlists(playlists)
         cp = self.music.current_playlist
         self.call_from_thread(self._rebuild_playlist_list, playlists, cp)
         self.call_from_thread(self._set_status, f"Refreshed — {len(playlists)} playlists")
@@ -872,28 +1352,22 @@ class MusicTUI(App):
 
     @on(Input.Changed, "#playlist-search")
     def on_search_changed(self, event: Input.Changed) -> None:
+        if self._search_timer is not None:
+            self._search_timer.stop()
         query = event.value.lower()
-        if not query:
-            filtered = self._all_playlists
-        else:
-            filtered = [p for p in self._all_playlists if query in p.lower()]
-        self._rebuild_playlist_list(filtered, self.music.current_playlist)
+        self._search_timer = self.set_timer(SEARCH_DEBOUNCE, lambda: self._apply_search(query))
+
+    def _apply_search(self, query: str) -> None:
+        self._search_timer = None
+        if self._search_visible:
+            self._rebuild_playlist_list(self._filter_playlists(query), self.music.current_playlist)
 
     @on(Input.Submitted, "#playlist-search")
     def on_search_submitted(self, event: Input.Submitted) -> None:
-        query = event.value.lower()
-        if query:
-            filtered = [p for p in self._all_playlists if query in p.lower()]
-        else:
-            filtered = self._all_playlists
+        filtered = self._filter_playlists(event.value.lower())
         if filtered:
             self._play_playlist_by_name(filtered[0])
-        self._search_visible = False
-        search_input = self.query_one("#playlist-search", Input)
-        search_input.remove_class("visible")
-        search_input.value = ""
-        self._rebuild_playlist_list(self._all_playlists, self.music.current_playlist)
-        self.query_one("#playlist-list", ListView).focus()
+        self._close_search()
 
     @on(ListView.Selected, "#playlist-list")
     def on_playlist_selected(self, event: ListView.Selected) -> None:
@@ -901,7 +1375,7 @@ class MusicTUI(App):
         if isinstance(item, PlaylistItem):
             self._play_playlist_by_name(item.playlist_name)
 
-    @work(thread=True)
+    @player_command
     def _play_playlist_by_name(self, name: str) -> None:
         cmd_play_playlist(name)
         self.call_from_thread(self._set_status, f"Playing: {name}")
@@ -909,12 +1383,7 @@ class MusicTUI(App):
     def on_key(self, event) -> None:
         # Let Escape close search if open
         if event.key == "escape" and self._search_visible:
-            self._search_visible = False
-            search_input = self.query_one("#playlist-search", Input)
-            search_input.remove_class("visible")
-            search_input.value = ""
-            self._rebuild_playlist_list(self._all_playlists, self.music.current_playlist)
-            self.query_one("#playlist-list", ListView).focus()
+            self._close_search()
             event.prevent_default()
 
 
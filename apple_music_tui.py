@@ -2,17 +2,46 @@
 import curses
 import locale
 import os
+import queue
+import re
+import select
+import shutil
 import subprocess
 import sys
+import tempfile
 import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
+
+from applescript_runner import AppleScriptRunner
+
+# Subprocesses: every child is started with close_fds=False, which lets
+# subprocess use posix_spawn instead of fork+exec. That is safe as long as
+# every descriptor we open stays non-inheritable, which is the default for
+# os.pipe(), open() and subprocess's own pipes (PEP 446). Only the terminal
+# on fds 0-2 reaches the child.
 
 APP_NAME = "Music"
-POLL_INTERVAL = 2.0
+POLL_INTERVAL = 5.0
+IDLE_POLL_INTERVAL = 6.0
+NOT_RUNNING_POLL_INTERVAL = 15.0
+ACTIVE_POLL_INTERVAL = 0.3
+ACTIVE_POLL_WINDOW = 3.0
+TRACK_END_POLL_INTERVAL = 0.5
+TRACK_END_WINDOW = 5.0
+PLAYLIST_REFRESH_SECONDS = 30.0
+FULL_FETCH_EVERY = 4
 APPLESCRIPT_TIMEOUT = 5.0
+UI_DUMP_TIMEOUT = 30.0
+UP_NEXT_UI_MAX_SKIP = 30
 STATUS_CLEAR_SECONDS = 5.0
+ANIMATION_STEP = 0.25
+IDLE_REDRAW_WAIT = 1.0
+RUNNING_CHECK_SECONDS = 3.0
+ACTION_DEBOUNCE_SECONDS = 0.2
 
 
 def init_locale() -> None:
@@ -51,10 +80,19 @@ class UpNextInfo:
 @dataclass
 class AppState:
     playlists: List[str] = field(default_factory=list)
+    playlists_folded: List[str] = field(default_factory=list)
+    playlists_version: int = 0
+    playlist_index: Dict[str, int] = field(default_factory=dict)
+    filtered_key: Tuple[int, str] = (-1, "")
+    filtered_cache: List[str] = field(default_factory=list)
+    filtered_folded: List[str] = field(default_factory=list)
     selected_index: int = 0
     now_playing: TrackInfo = field(default_factory=TrackInfo)
     up_next: UpNextInfo = field(default_factory=UpNextInfo)
     up_next_source: str = "playlist"
+    up_next_ui_backoff: int = 0
+    up_next_ui_skip: int = 0
+    up_next_ui_track: str = ""
     status: str = ""
     status_set_time: float = 0.0
     last_poll: float = 0.0
@@ -64,40 +102,368 @@ class AppState:
     repeat_mode: Optional[str] = None
     current_playlist_name: str = ""
     search_query: str = ""
+    search_folded: str = ""
     search_active: bool = False
     show_help: bool = False
+    help_win: Optional["curses.window"] = None
+    help_win_key: tuple = ()
     controls: dict = field(default_factory=dict)
     playlist_box_info: Tuple[int, int, int, int] = (0, 0, 0, 0)
     lock: threading.Lock = field(default_factory=threading.Lock)
     stop_event: threading.Event = field(default_factory=threading.Event)
+    wake_event: threading.Event = field(default_factory=threading.Event)
     playlists_loaded: bool = False
+    playlists_fingerprint: str = ""
+    music_running: bool = True
+    music_running_checked_at: float = 0.0
+    last_draw_key: tuple = ()
+    pool: ThreadPoolExecutor = field(default_factory=lambda: ThreadPoolExecutor(max_workers=3))
+    redraw_pipe: Tuple[int, int] = field(default_factory=os.pipe)
+    action_queue: queue.Queue = field(default_factory=queue.Queue)
+    last_action_time: float = 0.0
+    debounce_times: Dict[object, float] = field(default_factory=dict)
 
 
 # ── AppleScript helpers ──────────────────────────────────────────────
 
 
 def set_status(state, msg: str) -> None:
-    state.status = msg
-    state.status_set_time = time.time()
+    with state.lock:
+        state.status = msg
+        state.status_set_time = time.monotonic()
+    request_redraw(state)
+
+
+def request_redraw(state) -> None:
+    """Wake the UI loop from another thread; it sleeps in select() otherwise."""
+    try:
+        os.write(state.redraw_pipe[1], b"x")
+    except (BlockingIOError, OSError):
+        pass
 
 
-def run_applescript(script: str, timeout: float = APPLESCRIPT_TIMEOUT) -> Tuple[str, str, int]:
+def run_osascript_once(args: List[str], timeout: float = APPLESCRIPT_TIMEOUT) -> Tuple[str, str, int]:
     proc = subprocess.Popen(
-        ["/usr/bin/osascript", "-e", script],
+        ["/usr/bin/osascript", *args],
         stdout=subprocess.PIPE,
         stderr=subprocess.PIPE,
-        text=True,
+        close_fds=False,  # see module note
     )
     try:
         out, err = proc.communicate(timeout=timeout)
-        return out.strip(), err.strip(), proc.returncode
+        text = out.decode("utf-8", "replace").strip() if out else ""
+        error = err.decode("utf-8", "replace").strip() if err else ""
+        return text, error, proc.returncode
     except subprocess.TimeoutExpired:
         proc.kill()
         proc.wait()
         return "", "AppleScript timed out", -1
 
 
+AS_QUOTE = str.maketrans({"\\": "\\\\", '"': '\\"', "\n": "\\n", "\r": "\\r"})
+
+
+def applescript_quote(value: str) -> str:
+    return '"' + value.translate(AS_QUOTE) + '"'
+
+
+runner = AppleScriptRunner()
+# The poll-time System Events lookups (up next) get their own child so they
+# can overlap Music polls. Only those short lookups may use it: poll_once
+# waits on them, so anything slow here would stall every tick.
+ui_runner = AppleScriptRunner()
+
+
+# Scripts that run on every poll, back a key binding or take user-supplied
+# values are compiled once per session. Inputs arrive through `on run argv`,
+# so they are never spliced into the source and need no escaping.
+SCRIPT_SOURCES = {
+    "tick_bundle": f'''
+    on run argv
+        set FS to character id 31
+        set RS to character id 30
+        set wantFull to (item 1 of argv) is "full"
+        tell application "{APP_NAME}"
+            if it is not running then return "NOT_RUNNING"
+            set trackRec to "STOPPED"
+            set cpName to ""
+            if player state is not stopped then
+                try
+                    set t to current track
+                    if wantFull then
+                        set trackRec to (name of t) & FS & (artist of t) & FS & (album of t) & FS & (player state as string) & FS & (duration of t) & FS & player position
+                    else
+                        set trackRec to (name of t) & FS & (player state as string)
+                    end if
+                end try
+                try
+                    set cpName to name of current playlist
+                end try
+            end if
+            set shuf to "UNKNOWN"
+            try
+                set shuf to shuffle enabled of current playlist as string
+            on error
+                try
+                    set shuf to shuffle enabled as string
+                end try
+            end try
+            set rpt to "UNKNOWN"
+            try
+                set rpt to song repeat as string
+            end try
+            set vol to "-1"
+            try
+                set vol to sound volume as string
+            end try
+            return trackRec & RS & shuf & RS & rpt & RS & vol & RS & cpName
+        end tell
+    end run
+    ''',
+    "playlists": f'''
+    on run argv
+        set AppleScript's text item delimiters to "\\n"
+        tell application "{APP_NAME}"
+            if it is running then
+                set fp to ((count of playlists) as string) & "|" & ((count of user playlists) as string)
+                if fp is (item 1 of argv) then return "UNCHANGED"
+                set plist to name of playlists
+                return fp & "\\n" & (plist as text)
+            end if
+        end tell
+        return "NOT_RUNNING"
+    end run
+    ''',
+    "up_next_ui": f'''
+    on run argv
+        tell application "System Events"
+            if not (exists process "{APP_NAME}") then
+                return "NO_PROCESS"
+            end if
+            tell process "{APP_NAME}"
+                if not (exists window 1) then
+                    return "NO_WINDOW"
+                end if
+                try
+                    set theTable to first table of scroll area 1 of window 1
+                    set row1 to first row of theTable
+                    set texts to value of static text of row1
+                    if (count of texts) >= 2 then
+                        return item 1 of texts & "\\n" & item 2 of texts
+                    else if (count of texts) = 1 then
+                        return item 1 of texts
+                    else
+                        return "NO_TEXT"
+                    end if
+                on error errMsg number errNum
+                    return "ERR:" & errNum & ":" & errMsg
+                end try
+            end tell
+        end tell
+    end run
+    ''',
+    "up_next_playlist": f'''
+    on run argv
+        tell application "{APP_NAME}"
+            if it is running then
+                if player state is stopped then
+                    return "STOPPED"
+                end if
+                try
+                    set cp to current playlist
+                    set ct to current track
+                    set pid to persistent ID of ct
+                    set tracksList to tracks of cp
+                    repeat with i from 1 to count of tracksList
+                        if persistent ID of item i of tracksList is pid then
+                            if i < count of tracksList then
+                                set nt to item (i + 1) of tracksList
+                                return name of nt & "\\n" & artist of nt & "\\n" & album of nt
+                            else
+                                return "END"
+                            end if
+                        end if
+                    end repeat
+                    return "UNKNOWN"
+                on error
+                    return "UNKNOWN"
+                end try
+            end if
+        end tell
+        return "NOT_RUNNING"
+    end run
+    ''',
+    "set_volume": f'''
+    on run argv
+        tell application "{APP_NAME}" to set sound volume to (item 1 of argv as integer)
+    end run
+    ''',
+    "seek": f'''
+    on run argv
+        tell application "{APP_NAME}" to set player position to (item 1 of argv as integer)
+    end run
+    ''',
+    "play_playlist": f'''
+    on run argv
+        tell application "{APP_NAME}" to play playlist (item 1 of argv)
+    end run
+    ''',
+    "set_repeat": f'''
+    on run argv
+        set mode to item 1 of argv
+        tell application "{APP_NAME}"
+            if mode is "one" then
+                set song repeat to one
+            else if mode is "all" then
+                set song repeat to all
+            else
+                set song repeat to off
+            end if
+        end tell
+    end run
+    ''',
+    "toggle_shuffle": f'''
+    on run argv
+        tell application "{APP_NAME}"
+            if it is running then
+                try
+                    set thePlaylist to current playlist
+                    set shuffle enabled of thePlaylist to not shuffle enabled of thePlaylist
+                    return shuffle enabled of thePlaylist as string
+                on error errMsg number errNum
+                    try
+                        set shuffle enabled to not shuffle enabled
+                        return shuffle enabled as string
+                    on error errMsg2 number errNum2
+                        return "ERR:" & errNum2 & ":" & errMsg2
+                    end try
+                end try
+            end if
+        end tell
+        return "NOT_RUNNING"
+    end run
+    ''',
+    "shuffle_state": f'''
+    on run argv
+        tell application "{APP_NAME}"
+            if it is running then
+                try
+                    set thePlaylist to current playlist
+                    return shuffle enabled of thePlaylist as string
+                on error
+                    try
+                        return shuffle enabled as string
+                    on error
+                        return "UNKNOWN"
+                    end try
+                end try
+            end if
+        end tell
+        return "UNKNOWN"
+    end run
+    ''',
+    "volume": f'''
+    on run argv
+        tell application "{APP_NAME}"
+            if it is running then
+                return sound volume as string
+            end if
+        end tell
+        return "-1"
+    end run
+    ''',
+    "music_running": f'''
+    on run argv
+        tell application "System Events" to return (exists process "{APP_NAME}") as string
+    end run
+    ''',
+}
+
+COMPILED_SCRIPTS: Dict[str, str] = {}
+compile_lock = threading.Lock()
+compile_dir = ""
+
+
+def compiled_script_path(name: str) -> str:
+    """Compile SCRIPT_SOURCES[name] on first use; "" means osacompile failed."""
+    global compile_dir
+    with compile_lock:
+        if name in COMPILED_SCRIPTS:
+            return COMPILED_SCRIPTS[name]
+        path = ""
+        try:
+            if not compile_dir:
+                compile_dir = tempfile.mkdtemp(prefix="musictui_")
+            target = os.path.join(compile_dir, f"{name}.scpt")
+            proc = subprocess.run(
+                ["/usr/bin/osacompile", "-o", target, "-e", SCRIPT_SOURCES[name]],
+                capture_output=True,
+                timeout=APPLESCRIPT_TIMEOUT,
+                close_fds=False,  # see module note
+            )
+            if proc.returncode == 0:
+                path = target
+        except (OSError, subprocess.SubprocessError):
+            pass
+        COMPILED_SCRIPTS[name] = path
+        return path
+
+
+def remove_compiled_scripts() -> None:
+    with compile_lock:
+        if compile_dir:
+            shutil.rmtree(compile_dir, ignore_errors=True)
+        COMPILED_SCRIPTS.clear()
+
+
+def script_call(name: str, args: Tuple[str, ...]) -> str:
+    """AppleScript expression that runs SCRIPT_SOURCES[name] with args."""
+    path = compiled_script_path(name)
+    if path:
+        target = f"(POSIX file {applescript_quote(path)})"
+    else:
+        target = applescript_quote(SCRIPT_SOURCES[name])
+    params = ", ".join(applescript_quote(a) for a in args)
+    return f"run script {target} with parameters {{{params}}}"
+
+
+def run_script(
+    name: str,
+    *args: str,
+    timeout: float = APPLESCRIPT_TIMEOUT,
+    via: AppleScriptRunner = runner,
+) -> Tuple[str, str, int]:
+    result = via.evaluate(script_call(name, args), timeout)
+    if result is not None:
+        return result
+    path = compiled_script_path(name)
+    cmd = [path] if path else ["-e", SCRIPT_SOURCES[name]]
+    return run_osascript_once([*cmd, *args], timeout)
+
+
+BATCH_SEP = "\x1d"
+
+
+def run_script_batch(
+    calls: List[Tuple[str, Tuple[str, ...]]],
+    timeout: float = APPLESCRIPT_TIMEOUT,
+) -> Tuple[List[str], str, int]:
+    """Run several SCRIPT_SOURCES entries in one round trip; one result each."""
+    expr = " & (character id 29) & ".join(f"({script_call(name, args)})" for name, args in calls)
+    result = runner.evaluate(expr, timeout)
+    if result is None:
+        result = run_osascript_once(["-e", expr], timeout)
+    out, err, code = result
+    parts = [part.strip() for part in out.split(BATCH_SEP)]
+    return (parts + [""] * len(calls))[:len(calls)], err, code
+
+
 def dump_music_ui(state: AppState) -> None:
+    set_status(state, "Dumping UI...")
+    state.pool.submit(dump_music_ui_worker, state)
+
+
+def dump_music_ui_worker(state: AppState) -> None:
     script = f'''
     on walk_element(el, depth)
         set pad to ""
@@ -146,84 +512,62 @@ def dump_music_ui(state: AppState) -> None:
         end tell
     end tell
     '''
-    out, err, code = run_applescript(script)
+    # The walk can take up to UI_DUMP_TIMEOUT. Both REPL children serve the
+    # poller (ui_runner backs the up-next lookup every tick waits on), so
+    # this rare action runs as a one-shot osascript instead.
+    out, err, code = run_osascript_once(["-e", script], UI_DUMP_TIMEOUT)
     if err or code != 0 or out.startswith("ERR:"):
         set_status(state, "Failed to dump UI. Ensure Accessibility is enabled.")
         return
     path = "/tmp/musictui_upnext.txt"
     try:
-        with open(path, "w", encoding="utf-8") as handle:
+        # Write beside the target and swap it in, so readers never see half a dump.
+        with tempfile.NamedTemporaryFile(
+            "w", encoding="utf-8", dir=os.path.dirname(path), delete=False
+        ) as handle:
             handle.write(out)
+        os.replace(handle.name, path)
         set_status(state, f"UI dump saved: {path}")
     except OSError:
         set_status(state, "Failed to write UI dump.")
 
 
-def applescript_escape(value: str) -> str:
-    escaped = value.replace("\\", "\\\\").replace('"', '\\"')
-    return escaped.replace("\n", " ").replace("\r", " ")
+AUTH_ERROR_RE = re.compile(r"not (?:authori[sz]ed|permitted)", re.IGNORECASE)
 
 
 def format_error(err: str) -> str:
     if not err:
         return ""
-    lowered = err.lower()
-    if "not authorized" in lowered or "not authorised" in lowered or "not permitted" in lowered:
+    if AUTH_ERROR_RE.search(err):
         return "Permission denied. Enable Automation for your terminal in System Settings > Privacy & Security > Automation."
     return err
 
 
+NUMBER_RE = re.compile(r"-?\d*\.?\d+")
+
+
+@lru_cache(maxsize=64)
 def parse_applescript_number(raw: str) -> float:
     if not raw:
         return 0.0
     text = raw.strip()
+    try:
+        # Positions and durations normally arrive as plain "212.0".
+        return float(text)
+    except ValueError:
+        pass
     if "," in text and "." not in text:
         text = text.replace(",", ".")
     else:
         text = text.replace(",", "")
-    filtered = "".join(ch for ch in text if ch.isdigit() or ch in ".-")
-    if not filtered:
-        return 0.0
-    try:
-        return float(filtered)
-    except ValueError:
-        return 0.0
+    match = NUMBER_RE.search(text)
+    return float(match.group()) if match else 0.0
 
 
 # ── Fetchers ─────────────────────────────────────────────────────────
 
 
-def fetch_now_playing(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            if player state is stopped then
-                return "STOPPED"
-            end if
-            set t to current track
-            set n to name of t
-            set a to artist of t
-            set al to album of t
-            set s to player state as string
-            set d to duration of t
-            set p to player position
-            return n & "\\n" & a & "\\n" & al & "\\n" & s & "\\n" & d & "\\n" & p
-        end if
-    end tell
-    return "NOT_RUNNING"
-    '''
-    out, err, code = run_applescript(script)
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-        return
-    if code != 0:
-        set_status(state, "AppleScript failed.")
-        return
-    if out in ("STOPPED", "NOT_RUNNING", ""):
-        state.now_playing = TrackInfo(state=out or "UNKNOWN")
-        return
-    parts = out.split("\n")
+def apply_track_fields(state: AppState, parts: List[str]) -> None:
     if len(parts) >= 6:
         duration = parse_applescript_number(parts[4])
         position = parse_applescript_number(parts[5])
@@ -235,7 +579,7 @@ def fetch_now_playing(state: AppState) -> None:
             duration=duration,
             position=position,
         )
-        state.last_position_time = time.time()
+        state.last_position_time = time.monotonic()
     elif len(parts) >= 4:
         state.now_playing = TrackInfo(
             name=parts[0],
@@ -243,11 +587,101 @@ def fetch_now_playing(state: AppState) -> None:
             album=parts[2],
             state=parts[3].upper(),
         )
-        state.last_position_time = time.time()
+        state.last_position_time = time.monotonic()
+
+
+def parse_shuffle(out: str) -> Optional[bool]:
+    if out == "true":
+        return True
+    if out == "false":
+        return False
+    return None
+
+
+def parse_repeat_mode(out: str) -> Optional[str]:
+    out_lower = out.strip().lower()
+    if out_lower in ("off", "none"):
+        return "off"
+    if out_lower in ("one", "all"):
+        return out_lower
+    return None
+
+
+FIELD_SEP = "\x1f"
+RECORD_SEP = "\x1e"
+
+
+def script_succeeded(state: AppState, err: str, code: int) -> bool:
+    err_msg = format_error(err)
+    if err_msg:
+        set_status(state, err_msg)
+        return False
+    if code != 0:
+        set_status(state, "AppleScript failed.")
+        return False
+    return True
+
+
+def fetch_tick_bundle(state: AppState, full: bool = True) -> None:
+    """Read track, shuffle, repeat, volume and playlist name in one osascript call.
+
+    With full=False only the track name and player state are read; position
+    is extrapolated locally, and a change of track or state triggers a full
+    read straight away.
+    """
+    out, err, code = run_script("tick_bundle", "full" if full else "light")
+    if script_succeeded(state, err, code):
+        apply_tick_bundle(state, out, full)
+
+
+def apply_tick_bundle(state: AppState, out: str, full: bool) -> None:
+    records = out.split(RECORD_SEP)
+    if len(records) < 5:
+        state.now_playing = TrackInfo(state=out or "UNKNOWN")
+        return
+    track_rec, shuf, rpt, vol, playlist_name = records[:5]
+    if track_rec == "STOPPED":
+        if state.now_playing.state != "STOPPED":
+            state.now_playing = TrackInfo(state="STOPPED")
+    elif full:
+        apply_track_fields(state, track_rec.split(FIELD_SEP))
+    else:
+        name, _, player_state = track_rec.partition(FIELD_SEP)
+        info = state.now_playing
+        if name != info.name or player_state.upper() != info.state:
+            fetch_tick_bundle(state, full=True)
+            return
+    # These rarely change between polls; skip the write when they haven't.
+    shuffle = parse_shuffle(shuf)
+    if shuffle != state.shuffle_enabled:
+        state.shuffle_enabled = shuffle
+    repeat_mode = parse_repeat_mode(rpt)
+    if repeat_mode != state.repeat_mode:
+        state.repeat_mode = repeat_mode
+    volume = int(parse_applescript_number(vol))
+    if volume >= 0 and volume != state.volume:
+        state.volume = volume
+    playlist_name = playlist_name.strip()
+    if playlist_name != state.current_playlist_name:
+        state.current_playlist_name = playlist_name
 
 
 def fetch_up_next(state: AppState) -> None:
-    ui_info = fetch_up_next_ui()
+    # Without Accessibility access (or with the queue hidden) the UI lookup
+    # fails every time, so back off, but retry as soon as the track changes.
+    track = state.now_playing.name
+    if state.up_next_ui_skip > 0 and track == state.up_next_ui_track:
+        state.up_next_ui_skip -= 1
+        ui_info = None
+    else:
+        ui_info = fetch_up_next_ui()
+        if ui_info:
+            state.up_next_ui_backoff = 0
+            state.up_next_ui_skip = 0
+        else:
+            state.up_next_ui_backoff = min(state.up_next_ui_backoff * 2 + 1, UP_NEXT_UI_MAX_SKIP)
+            state.up_next_ui_skip = state.up_next_ui_backoff
+            state.up_next_ui_track = track
     if ui_info:
         state.up_next = ui_info
         state.up_next_source = "ui"
@@ -257,33 +691,7 @@ def fetch_up_next(state: AppState) -> None:
 
 
 def fetch_up_next_ui() -> Optional[UpNextInfo]:
-    script = f'''
-    tell application "System Events"
-        if not (exists process "{APP_NAME}") then
-            return "NO_PROCESS"
-        end if
-        tell process "{APP_NAME}"
-            if not (exists window 1) then
-                return "NO_WINDOW"
-            end if
-            try
-                set theTable to first table of scroll area 1 of window 1
-                set row1 to first row of theTable
-                set texts to value of static text of row1
-                if (count of texts) >= 2 then
-                    return item 1 of texts & "\\n" & item 2 of texts
-                else if (count of texts) = 1 then
-                    return item 1 of texts
-                else
-                    return "NO_TEXT"
-                end if
-            on error errMsg number errNum
-                return "ERR:" & errNum & ":" & errMsg
-            end try
-        end tell
-    end tell
-    '''
-    out, err, code = run_applescript(script)
+    out, err, code = run_script("up_next_ui", via=ui_runner)
     if err or code != 0:
         return None
     if out.startswith("ERR:") or out in ("NO_PROCESS", "NO_WINDOW", "NO_TEXT", ""):
@@ -295,36 +703,7 @@ def fetch_up_next_ui() -> Optional[UpNextInfo]:
 
 
 def fetch_up_next_playlist(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            if player state is stopped then
-                return "STOPPED"
-            end if
-            try
-                set cp to current playlist
-                set ct to current track
-                set pid to persistent ID of ct
-                set tracksList to tracks of cp
-                repeat with i from 1 to count of tracksList
-                    if persistent ID of item i of tracksList is pid then
-                        if i < count of tracksList then
-                            set nt to item (i + 1) of tracksList
-                            return name of nt & "\\n" & artist of nt & "\\n" & album of nt
-                        else
-                            return "END"
-                        end if
-                    end if
-                end repeat
-                return "UNKNOWN"
-            on error
-                return "UNKNOWN"
-            end try
-        end if
-    end tell
-    return "NOT_RUNNING"
-    '''
-    out, err, code = run_applescript(script)
+    out, err, code = run_script("up_next_playlist", via=ui_runner)
     err_msg = format_error(err)
     if err_msg or code != 0:
         state.up_next = UpNextInfo(status="ERROR")
@@ -342,32 +721,40 @@ def fetch_up_next_playlist(state: AppState) -> None:
         )
 
 
-def fetch_playlists(state: AppState) -> None:
-    script = f'''
-    set AppleScript's text item delimiters to "\\n"
-    tell application "{APP_NAME}"
-        if it is running then
-            set plist to name of playlists
-            return plist as text
-        end if
-    end tell
-    return "NOT_RUNNING"
-    '''
-    out, err, code = run_applescript(script)
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-        return
-    if code != 0:
-        set_status(state, "AppleScript failed.")
+def fetch_all(state: AppState) -> None:
+    """Playlists and a full tick bundle in one round trip, for startup and `r`."""
+    (playlists_out, tick_out), err, code = run_script_batch([
+        ("playlists", (state.playlists_fingerprint,)),
+        ("tick_bundle", ("full",)),
+    ])
+    if script_succeeded(state, err, code):
+        apply_playlists(state, playlists_out)
+        apply_tick_bundle(state, tick_out, full=True)
+
+
+def apply_playlists(state: AppState, out: str) -> None:
+    if out == "UNCHANGED":
         return
     if out in ("NOT_RUNNING", ""):
         state.playlists = []
+        state.playlists_folded = []
+        state.playlist_index = {}
+        state.playlists_version += 1
+        state.playlists_fingerprint = ""
         state.selected_index = 0
         set_status(state, "Music app is not running.")
         return
-    playlists = [p.strip() for p in out.split("\n") if p.strip()]
+    fingerprint, _, names = out.partition("\n")
+    playlists = [p.strip() for p in names.split("\n") if p.strip()]
     state.playlists = playlists
+    state.playlists_folded = [p.casefold() for p in playlists]
+    # Maps a name back to its first position, as list.index() did.
+    index: Dict[str, int] = {}
+    for i, name in enumerate(playlists):
+        index.setdefault(name, i)
+    state.playlist_index = index
+    state.playlists_version += 1
+    state.playlists_fingerprint = fingerprint
     if state.selected_index >= len(playlists):
         state.selected_index = max(0, len(playlists) - 1)
     set_status(state, f"Loaded {len(playlists)} playlists.")
@@ -376,50 +763,47 @@ def fetch_playlists(state: AppState) -> None:
 # ── Actions ──────────────────────────────────────────────────────────
 
 
-def play_pause(state: AppState) -> None:
-    _, err, code = run_applescript(f'tell application "{APP_NAME}" to playpause')
+# Transport commands never change, so each one-line script is built once and
+# sent to the runner as is, without the run script wrapper (and its compile).
+CONTROL_SCRIPTS = {
+    verb: f'tell application "{APP_NAME}" to {verb}'
+    for verb in ("playpause", "next track", "previous track", "play", "pause", "stop")
+}
+
+
+def run_control(state: AppState, verb: str, done_msg: str) -> None:
+    line = CONTROL_SCRIPTS[verb]
+    result = runner.evaluate(line)
+    if result is None:
+        result = run_osascript_once(["-e", line])
+    _, err, code = result
     err_msg = format_error(err)
     if err_msg:
         set_status(state, err_msg)
     elif code != 0:
         set_status(state, "AppleScript failed.")
     else:
-        set_status(state, "Toggled play/pause.")
+        set_status(state, done_msg)
+
+
+def play_pause(state: AppState) -> None:
+    run_control(state, "playpause", "Toggled play/pause.")
 
 
 def next_track(state: AppState) -> None:
-    _, err, code = run_applescript(f'tell application "{APP_NAME}" to next track')
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-    elif code != 0:
-        set_status(state, "AppleScript failed.")
-    else:
-        set_status(state, "Next track.")
+    run_control(state, "next track", "Next track.")
 
 
 def previous_track(state: AppState) -> None:
-    _, err, code = run_applescript(f'tell application "{APP_NAME}" to previous track')
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-    elif code != 0:
-        set_status(state, "AppleScript failed.")
-    else:
-        set_status(state, "Previous track.")
+    run_control(state, "previous track", "Previous track.")
 
 
 def play_selected_playlist(state: AppState) -> None:
     if not state.playlists:
         set_status(state, "No playlists found.")
         return
-    name = applescript_escape(state.playlists[state.selected_index])
-    script = f'''
-    tell application "{APP_NAME}"
-        play playlist "{name}"
-    end tell
-    '''
-    _, err, code = run_applescript(script)
+    name = state.playlists[state.selected_index]
+    _, err, code = run_script("play_playlist", name)
     err_msg = format_error(err)
     if err_msg:
         set_status(state, err_msg)
@@ -430,26 +814,7 @@ def play_selected_playlist(state: AppState) -> None:
 
 
 def toggle_shuffle(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            try
-                set thePlaylist to current playlist
-                set shuffle enabled of thePlaylist to not shuffle enabled of thePlaylist
-                return shuffle enabled of thePlaylist as string
-            on error errMsg number errNum
-                try
-                    set shuffle enabled to not shuffle enabled
-                    return shuffle enabled as string
-                on error errMsg2 number errNum2
-                    return "ERR:" & errNum2 & ":" & errMsg2
-                end try
-            end try
-        end if
-    end tell
-    return "NOT_RUNNING"
-    '''
-    out, err, code = run_applescript(script)
+    out, err, code = run_script("toggle_shuffle")
     err_msg = format_error(err)
     if err_msg:
         set_status(state, err_msg)
@@ -467,46 +832,16 @@ def toggle_shuffle(state: AppState) -> None:
 
 
 def fetch_shuffle_state(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            try
-                set thePlaylist to current playlist
-                return shuffle enabled of thePlaylist as string
-            on error
-                try
-                    return shuffle enabled as string
-                on error
-                    return "UNKNOWN"
-                end try
-            end try
-        end if
-    end tell
-    return "UNKNOWN"
-    '''
-    out, err, code = run_applescript(script)
+    out, err, code = run_script("shuffle_state")
     err_msg = format_error(err)
     if err_msg or code != 0:
         state.shuffle_enabled = None
         return
-    if out == "true":
-        state.shuffle_enabled = True
-    elif out == "false":
-        state.shuffle_enabled = False
-    else:
-        state.shuffle_enabled = None
+    state.shuffle_enabled = parse_shuffle(out)
 
 
 def fetch_volume(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            return sound volume as string
-        end if
-    end tell
-    return "-1"
-    '''
-    out, err, code = run_applescript(script)
+    out, err, code = run_script("volume")
     if err or code != 0:
         return
     try:
@@ -519,8 +854,7 @@ def set_volume(state: AppState, delta: int) -> None:
     if state.volume < 0:
         fetch_volume(state)
     new_vol = max(0, min(100, state.volume + delta))
-    script = f'tell application "{APP_NAME}" to set sound volume to {new_vol}'
-    _, err, code = run_applescript(script)
+    _, err, code = run_script("set_volume", str(new_vol))
     if err or code != 0:
         set_status(state, "Volume change failed.")
     else:
@@ -536,8 +870,7 @@ def toggle_mute(state: AppState) -> None:
         new_vol = 0
     else:
         new_vol = getattr(state, "_pre_mute_volume", 50)
-    script = f'tell application "{APP_NAME}" to set sound volume to {new_vol}'
-    _, err, code = run_applescript(script)
+    _, err, code = run_script("set_volume", str(new_vol))
     if err or code != 0:
         set_status(state, "Mute toggle failed.")
     else:
@@ -550,53 +883,22 @@ def seek_track(state: AppState, delta: float) -> None:
     if info.state not in ("PLAYING", "PAUSED"):
         set_status(state, "Nothing to seek.")
         return
-    new_pos = max(0.0, min(info.duration, info.position + delta))
-    script = f'tell application "{APP_NAME}" to set player position to {new_pos}'
-    _, err, code = run_applescript(script)
+    new_pos = max(0.0, min(info.duration, current_position(state) + delta))
+    _, err, code = run_script("seek", str(round(new_pos)))
     if err or code != 0:
         set_status(state, "Seek failed.")
     else:
         state.now_playing.position = new_pos
-        state.last_position_time = time.time()
+        state.last_position_time = time.monotonic()
         direction = "forward" if delta > 0 else "back"
         set_status(state, f"Seek {direction} {abs(int(delta))}s.")
 
 
-def fetch_repeat_mode(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            try
-                return song repeat as string
-            on error
-                return "UNKNOWN"
-            end try
-        end if
-    end tell
-    return "UNKNOWN"
-    '''
-    out, err, code = run_applescript(script)
-    if err or code != 0:
-        state.repeat_mode = None
-        return
-    out_lower = out.strip().lower()
-    if out_lower in ("off", "none"):
-        state.repeat_mode = "off"
-    elif out_lower in ("one",):
-        state.repeat_mode = "one"
-    elif out_lower in ("all",):
-        state.repeat_mode = "all"
-    else:
-        state.repeat_mode = None
-
-
 def toggle_repeat(state: AppState) -> None:
     cycle = {"off": "all", "all": "one", "one": "off"}
     current = state.repeat_mode or "off"
     next_mode = cycle.get(current, "off")
-    as_val = {"off": "off", "one": "one", "all": "all"}[next_mode]
-    script = f'tell application "{APP_NAME}" to set song repeat to {as_val}'
-    _, err, code = run_applescript(script)
+    _, err, code = run_script("set_repeat", next_mode)
     if err or code != 0:
         set_status(state, "Repeat toggle failed.")
     else:
@@ -604,89 +906,106 @@ def toggle_repeat(state: AppState) -> None:
         set_status(state, f"Repeat: {next_mode}.")
 
 
-def fetch_current_playlist_name(state: AppState) -> None:
-    script = f'''
-    tell application "{APP_NAME}"
-        if it is running then
-            if player state is not stopped then
-                try
-                    return name of current playlist
-                on error
-                    return ""
-                end try
-            end if
-        end if
-    end tell
-    return ""
-    '''
-    out, err, code = run_applescript(script)
-    if err or code != 0:
-        state.current_playlist_name = ""
-        return
-    state.current_playlist_name = out.strip()
-
-
 def play_track(state: AppState) -> None:
-    _, err, code = run_applescript(f'tell application "{APP_NAME}" to play')
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-    elif code != 0:
-        set_status(state, "AppleScript failed.")
-    else:
-        set_status(state, "Play.")
+    run_control(state, "play", "Play.")
 
 
 def pause_track(state: AppState) -> None:
-    _, err, code = run_applescript(f'tell application "{APP_NAME}" to pause')
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-    elif code != 0:
-        set_status(state, "AppleScript failed.")
-    else:
-        set_status(state, "Pause.")
+    run_control(state, "pause", "Pause.")
 
 
 def stop_track(state: AppState) -> None:
-    _, err, code = run_applescript(f'tell application "{APP_NAME}" to stop')
-    err_msg = format_error(err)
-    if err_msg:
-        set_status(state, err_msg)
-    elif code != 0:
-        set_status(state, "AppleScript failed.")
+    run_control(state, "stop", "Stop.")
+
+
+def check_music_running(state: AppState) -> bool:
+    """Cheap "is Music open?" probe, re-run at most every RUNNING_CHECK_SECONDS."""
+    now = time.monotonic()
+    if now - state.music_running_checked_at < RUNNING_CHECK_SECONDS:
+        return state.music_running
+    out, err, code = run_script("music_running")
+    state.music_running_checked_at = now
+    # If the probe itself fails, let the real fetchers report the problem.
+    state.music_running = out != "false" or bool(err) or code != 0
+    return state.music_running
+
+
+def clear_player_state(state: AppState) -> None:
+    state.now_playing = TrackInfo(state="NOT_RUNNING")
+    state.up_next = UpNextInfo()
+    state.shuffle_enabled = None
+    state.volume = -1
+    state.repeat_mode = None
+    state.current_playlist_name = ""
+
+
+def current_position(state: AppState, now: Optional[float] = None) -> float:
+    """Playback position extrapolated from the last fetch."""
+    info = state.now_playing
+    if info.state == "PLAYING" and state.last_position_time:
+        if now is None:
+            now = time.monotonic()
+        elapsed = max(0.0, now - state.last_position_time)
+        return min(info.duration, info.position + elapsed)
+    return info.position
+
+
+def compute_interval(state: AppState, now: float) -> float:
+    """Poll quickly right after a key press or near a track change, slowly when idle
+    and slowest while Music is closed."""
+    if now - state.last_action_time < ACTIVE_POLL_WINDOW:
+        return ACTIVE_POLL_INTERVAL
+    info = state.now_playing
+    if info.state == "NOT_RUNNING":
+        return NOT_RUNNING_POLL_INTERVAL
+    if info.state != "PLAYING":
+        return IDLE_POLL_INTERVAL
+    if info.duration > 0 and info.duration - current_position(state, now) < TRACK_END_WINDOW:
+        return TRACK_END_POLL_INTERVAL
+    return POLL_INTERVAL
+
+
+def poll_once(state: AppState, full: bool, playlists: bool = False) -> None:
+    # The up-next lookup runs on ui_runner, so it overlaps the Music poll
+    # instead of queueing behind it. The wait below assumes nothing slow shares
+    # that child; long one-off calls such as the UI dump run one-shot instead.
+    up_next = state.pool.submit(fetch_up_next, state)
+    if playlists:
+        fetch_all(state)
     else:
-        set_status(state, "Stop.")
+        fetch_tick_bundle(state, full=full)
+    up_next.result()
 
 
 def background_poll(state: AppState) -> None:
-    fetch_playlists(state)
+    poll_once(state, full=True, playlists=True)
     with state.lock:
         state.playlists_loaded = True
-    fetch_now_playing(state)
-    fetch_up_next(state)
-    fetch_shuffle_state(state)
-    fetch_volume(state)
-    fetch_repeat_mode(state)
-    fetch_current_playlist_name(state)
+    request_redraw(state)
 
-    poll_count = 0
-    playlist_refresh_interval = 15
+    # Early wake-ups make polls irregular, so refresh playlists by elapsed time.
+    playlists_due = time.monotonic() + PLAYLIST_REFRESH_SECONDS
+    light_polls = 0
 
     while not state.stop_event.is_set():
-        state.stop_event.wait(POLL_INTERVAL)
+        state.wake_event.wait(compute_interval(state, time.monotonic()))
+        state.wake_event.clear()
         if state.stop_event.is_set():
             break
-        poll_count += 1
-        fetch_now_playing(state)
-        fetch_up_next(state)
-        fetch_shuffle_state(state)
-        fetch_volume(state)
-        fetch_repeat_mode(state)
-        fetch_current_playlist_name(state)
-        if poll_count >= playlist_refresh_interval:
-            fetch_playlists(state)
-            poll_count = 0
+        if not check_music_running(state):
+            clear_player_state(state)
+            request_redraw(state)
+            continue
+        light_polls += 1
+        now = time.monotonic()
+        refresh_playlists = now >= playlists_due
+        full = refresh_playlists or light_polls >= FULL_FETCH_EVERY
+        if full:
+            light_polls = 0
+        if refresh_playlists:
+            playlists_due = now + PLAYLIST_REFRESH_SECONDS
+        poll_once(state, full=full, playlists=refresh_playlists)
+        request_redraw(state)
 
 
 # ── Format helpers ───────────────────────────────────────────────────
@@ -695,7 +1014,12 @@ def background_poll(state: AppState) -> None:
 def format_time(seconds: float) -> str:
     if seconds <= 0:
         return "--:--"
-    total = int(seconds)
+    return format_seconds(int(seconds))
+
+
+# Drawn twice per frame but only changes once a second.
+@lru_cache(maxsize=256)
+def format_seconds(total: int) -> str:
     minutes = total // 60
     secs = total % 60
     return f"{minutes}:{secs:02d}"
@@ -732,10 +1056,18 @@ if USE_ASCII:
     BOX_TL, BOX_TR, BOX_BL, BOX_BR = "+", "+", "+", "+"
     BOX_H, BOX_V = "-", "|"
     PROG_FILLED, PROG_HEAD, PROG_EMPTY = "=", "O", "-"
+    INDICATOR_SEL, INDICATOR_PLAY = "> ", "# "
+    HEADER_TITLE, ARTIST_SEP, SEARCH_CURSOR = " Apple Music", "  -  ", "|"
+    STATE_DOTS, STATE_DOT_IDLE = {"PLAYING": ">", "PAUSED": "||"}, "."
+    CHIP_SHUFFLE, CHIP_REPEAT, CHIP_VOLUME = "~", "R", "#"
 else:
     BOX_TL, BOX_TR, BOX_BL, BOX_BR = "\u256d", "\u256e", "\u2570", "\u256f"
     BOX_H, BOX_V = "\u2500", "\u2502"
+    INDICATOR_SEL, INDICATOR_PLAY = "\u25b8 ", "\u266b "
     PROG_FILLED, PROG_HEAD, PROG_EMPTY = "\u2501", "\u25cf", "\u254c"
+    HEADER_TITLE, ARTIST_SEP, SEARCH_CURSOR = " \u266b Apple Music", "  \u00b7  ", "\u258f"
+    STATE_DOTS, STATE_DOT_IDLE = {"PLAYING": "\u25cf", "PAUSED": "\u23f8"}, "\u25cb"
+    CHIP_SHUFFLE, CHIP_REPEAT, CHIP_VOLUME = "\u21c6", "\u21bb", "\u266a"
 
 
 def init_colors() -> None:
@@ -756,29 +1088,54 @@ def init_colors() -> None:
     curses.init_pair(C_ART, curses.COLOR_BLUE, -1)
 
 
-def accent_pair(state: AppState) -> int:
-    ps = state.now_playing.state.upper() if state.now_playing.state else ""
-    if ps == "PLAYING":
-        return C_ACCENT_PLAY
-    if ps == "PAUSED":
-        return C_ACCENT_PAUSE
-    return C_ACCENT_STOP
+# Fetchers store the player state upper-cased, so these index it directly.
+ACCENT_PAIRS = {"PLAYING": C_ACCENT_PLAY, "PAUSED": C_ACCENT_PAUSE}
+SELECTED_PAIRS = {"PLAYING": C_SELECTED_PLAY, "PAUSED": C_SELECTED_PAUSE}
+
+
+@dataclass(frozen=True)
+class FrameAttrs:
+    """Curses attributes for one player state, shared by every draw_* call."""
+
+    acc: int
+    acc_bold: int
+    dim: int
+    bright: int
+    selected: int
+    status: int
+    header: int
 
 
-def selected_pair(state: AppState) -> int:
-    ps = state.now_playing.state.upper() if state.now_playing.state else ""
-    if ps == "PLAYING":
-        return C_SELECTED_PLAY
-    if ps == "PAUSED":
-        return C_SELECTED_PAUSE
-    return C_SELECTED_STOP
+def frame_attrs(state: AppState) -> FrameAttrs:
+    return attrs_for_player_state(state.now_playing.state)
+
+
+# Colour pairs are fixed after init_colors(), so the attributes only depend on
+# which accent the player state selects; build each set on first use.
+@lru_cache(maxsize=8)
+def attrs_for_player_state(player_state: str) -> FrameAttrs:
+    acc = curses.color_pair(ACCENT_PAIRS.get(player_state, C_ACCENT_STOP))
+    return FrameAttrs(
+        acc=acc,
+        acc_bold=acc | curses.A_BOLD,
+        dim=curses.color_pair(C_DIM) | curses.A_DIM,
+        bright=curses.color_pair(C_BRIGHT) | curses.A_BOLD,
+        selected=curses.color_pair(SELECTED_PAIRS.get(player_state, C_SELECTED_STOP)),
+        status=curses.color_pair(C_STATUS),
+        header=curses.color_pair(C_HEADER) | curses.A_BOLD,
+    )
 
 
 # ── Safe addstr (avoids curses crash at bottom-right corner) ─────────
 
 
+# Screen size for the frame being drawn. draw_ui sets it once, so the many
+# safe_addstr calls per frame skip a getmaxyx each.
+screen_size = [0, 0]
+
+
 def safe_addstr(stdscr, y, x, text, attr=0):
-    h, w = stdscr.getmaxyx()
+    h, w = screen_size
     if y < 0 or y >= h or x >= w:
         return
     max_len = w - x
@@ -795,39 +1152,82 @@ def safe_addstr(stdscr, y, x, text, attr=0):
             pass
 
 
-def draw_panel_border(stdscr, y, x, h, w, title="", attr=0):
-    if h < 2 or w < 4:
+def safe_chgat(stdscr, y, x, n, attr):
+    h, w = screen_size
+    if n <= 0 or y < 0 or y >= h or x >= w:
         return
-    dim = curses.color_pair(C_DIM) | curses.A_DIM
-    # Top border: ╭─ Title ────╮
+    try:
+        stdscr.chgat(y, x, min(n, w - x), attr)
+    except curses.error:
+        pass
+
+
+# Border and fill strings only depend on the panel size, so they are built
+# once per size; main() clears these caches when the terminal is resized.
+@lru_cache(maxsize=32)
+def border_top(w: int, title: str) -> str:
     if title:
-        top_line = BOX_TL + BOX_H + " " + title + " " + BOX_H * max(0, w - len(title) - 5) + BOX_TR
+        line = BOX_TL + BOX_H + " " + title + " " + BOX_H * max(0, w - len(title) - 5) + BOX_TR
     else:
-        top_line = BOX_TL + BOX_H * (w - 2) + BOX_TR
-    safe_addstr(stdscr, y, x, top_line[:w], dim)
+        line = BOX_TL + BOX_H * (w - 2) + BOX_TR
+    return line[:w]
+
+
+@lru_cache(maxsize=8)
+def border_bottom(w: int) -> str:
+    return (BOX_BL + BOX_H * (w - 2) + BOX_BR)[:w]
+
+
+@lru_cache(maxsize=8)
+def blank(w: int) -> str:
+    return " " * w
+
+
+def clear_layout_caches() -> None:
+    progress_bar.cache_clear()
+    border_top.cache_clear()
+    border_bottom.cache_clear()
+    blank.cache_clear()
+    compute_layout.cache_clear()
+
+
+@lru_cache(maxsize=256)
+def progress_bar(filled: int, bar_w: int) -> str:
+    if filled >= bar_w:
+        return PROG_FILLED * bar_w
+    return PROG_FILLED * filled + PROG_HEAD + PROG_EMPTY * (bar_w - filled - 1)
+
+
+def draw_panel_border(stdscr, y, x, h, w, attrs: FrameAttrs, title="", attr=0):
+    if h < 2 or w < 4:
+        return
+    dim = attrs.dim
+    # Top border: ╭─ Title ────╮
+    safe_addstr(stdscr, y, x, border_top(w, title), dim)
     if title:
         safe_addstr(stdscr, y, x + 3, title, attr | curses.A_BOLD)
-    # Side borders
-    for row in range(1, h - 1):
-        safe_addstr(stdscr, y + row, x, BOX_V, dim)
-        safe_addstr(stdscr, y + row, x + w - 1, BOX_V, dim)
+    # Side borders. Panels come from compute_layout, which keeps them on
+    # screen, so the per-row loop calls addstr directly through locals.
+    addstr = stdscr.addstr
+    right = x + w - 1
+    try:
+        for row in range(y + 1, y + h - 1):
+            addstr(row, x, BOX_V, dim)
+            addstr(row, right, BOX_V, dim)
+    except curses.error:
+        pass
     # Bottom border: ╰───────────╯
-    bot_line = BOX_BL + BOX_H * (w - 2) + BOX_BR
-    safe_addstr(stdscr, y + h - 1, x, bot_line[:w], dim)
+    safe_addstr(stdscr, y + h - 1, x, border_bottom(w), dim)
 
 
 # ── Drawing ──────────────────────────────────────────────────────────
 
 
-def draw_header(stdscr, width, state: AppState) -> None:
+def draw_header(stdscr, width, state: AppState, attrs: FrameAttrs, now: float) -> None:
     if width <= 0:
         return
-    ps = state.now_playing.state.upper() if state.now_playing.state else "UNKNOWN"
-    bar_attr = curses.color_pair(C_HEADER) | curses.A_BOLD
-    safe_addstr(stdscr, 0, 0, " " * (width - 1), bar_attr)
-
-    left = " Apple Music" if USE_ASCII else " ♫ Apple Music"
-    safe_addstr(stdscr, 0, 0, left, bar_attr)
+    ps = state.now_playing.state
+    left = HEADER_TITLE
 
     if USE_ASCII:
         if ps == "PLAYING":
@@ -838,26 +1238,30 @@ def draw_header(stdscr, width, state: AppState) -> None:
             indicator = ". stopped"
     else:
         if ps == "PLAYING":
-            frame_idx = int(time.time() * 4) % len(EQ_FRAMES)
+            frame_idx = int(now * 4) % len(EQ_FRAMES)
             eq = EQ_FRAMES[frame_idx]
             indicator = f"{eq} playing"
         elif ps == "PAUSED":
-            indicator = ("◐" if int(time.time()) % 2 == 0 else "◑") + " paused"
+            indicator = ("◐" if int(now) % 2 == 0 else "◑") + " paused"
         else:
             indicator = "○ stopped"
     right = f" {indicator} "
+    # Title, padding and indicator go out as one full-width write.
     if width > len(right) + len(left) + 1:
-        safe_addstr(stdscr, 0, width - len(right) - 1, right, bar_attr)
+        line = left.ljust(width - len(right) - 1) + right
+    else:
+        line = left.ljust(width - 1)
+    safe_addstr(stdscr, 0, 0, line, attrs.header)
 
 
-def draw_now_playing(stdscr, y, x, h, w, state: AppState) -> None:
+def draw_now_playing(stdscr, y, x, h, w, state: AppState, attrs: FrameAttrs, now: float) -> None:
     if h < 3 or w < 10:
         return
     info = state.now_playing
-    acc = curses.color_pair(accent_pair(state))
-    acc_bold = acc | curses.A_BOLD
-    dim = curses.color_pair(C_DIM) | curses.A_DIM
-    bright = curses.color_pair(C_BRIGHT) | curses.A_BOLD
+    acc = attrs.acc
+    acc_bold = attrs.acc_bold
+    dim = attrs.dim
+    bright = attrs.bright
 
     text_x = x + 1
     tw = w - 2
@@ -877,8 +1281,7 @@ def draw_now_playing(stdscr, y, x, h, w, state: AppState) -> None:
     if line < y + h:
         artist = info.artist or "Unknown"
         album = info.album or "Unknown"
-        sep = "  -  " if USE_ASCII else "  \u00b7  "
-        safe_addstr(stdscr, line, text_x, f"{artist}{sep}{album}"[:tw], dim)
+        safe_addstr(stdscr, line, text_x, f"{artist}{ARTIST_SEP}{album}"[:tw], dim)
         line += 1
 
     # Row 2: blank
@@ -886,19 +1289,14 @@ def draw_now_playing(stdscr, y, x, h, w, state: AppState) -> None:
 
     # Row 3: ● Playing   ⇆ On   ↻ All   ♪ 72%
     if line < y + h:
-        ps = info.state.upper()
-        if USE_ASCII:
-            sd = {"PLAYING": ">", "PAUSED": "||"}.get(ps, ".")
-            si, ri, vi = "~", "R", "#"
-        else:
-            sd = {"PLAYING": "\u25cf", "PAUSED": "\u23f8"}.get(ps, "\u25cb")
-            si, ri, vi = "\u21c6", "\u21bb", "\u266a"
+        ps = info.state
+        sd = STATE_DOTS.get(ps, STATE_DOT_IDLE)
         shuf = "On" if state.shuffle_enabled else "Off"
         if state.shuffle_enabled is None:
             shuf = "-"
         rpt = (state.repeat_mode or "-").capitalize()
-        vol_str = f"   {vi} {state.volume}%" if state.volume >= 0 else ""
-        chips = f"{sd} {ps.capitalize()}   {si} {shuf}   {ri} {rpt}{vol_str}"
+        vol_str = f"   {CHIP_VOLUME} {state.volume}%" if state.volume >= 0 else ""
+        chips = f"{sd} {ps.capitalize()}   {CHIP_SHUFFLE} {shuf}   {CHIP_REPEAT} {rpt}{vol_str}"
         safe_addstr(stdscr, line, text_x, chips[:tw], acc)
         line += 1
 
@@ -908,36 +1306,47 @@ def draw_now_playing(stdscr, y, x, h, w, state: AppState) -> None:
     # Row 5: full-width progress bar
     prog_y = y + h - 1
     if prog_y >= line:
-        time_l = format_time(info.position)
+        position = current_position(state, now)
+        time_l = format_time(position)
         time_r = format_time(info.duration)
         bar_w = tw - len(time_l) - len(time_r) - 2
         if bar_w >= 8:
-            safe_addstr(stdscr, prog_y, text_x, time_l, dim)
             bar_x = text_x + len(time_l) + 1
             if info.duration > 0:
-                ratio = max(0.0, min(1.0, info.position / info.duration))
+                ratio = max(0.0, min(1.0, position / info.duration))
             else:
                 ratio = 0.0
             filled = int(ratio * bar_w)
-            filled_str = PROG_FILLED * filled
-            dot_str = PROG_HEAD if filled < bar_w else ""
-            empty_str = PROG_EMPTY * max(0, bar_w - filled - 1)
-            safe_addstr(stdscr, prog_y, bar_x, filled_str, acc_bold)
-            safe_addstr(stdscr, prog_y, bar_x + filled, dot_str, bright)
-            safe_addstr(stdscr, prog_y, bar_x + filled + len(dot_str), empty_str, dim)
-            time_r_x = bar_x + bar_w + 1
-            safe_addstr(stdscr, prog_y, time_r_x, time_r, dim)
+            # One dim write for times and bar, then recolor the filled part
+            # and the head.
+            row = f"{time_l} {progress_bar(filled, bar_w)} {time_r}"
+            safe_addstr(stdscr, prog_y, text_x, row, dim)
+            safe_chgat(stdscr, prog_y, bar_x, filled, acc_bold)
+            if filled < bar_w:
+                safe_chgat(stdscr, prog_y, bar_x + filled, 1, bright)
         else:
             safe_addstr(stdscr, prog_y, text_x, f"{time_l} / {time_r}", dim)
 
 
-def draw_sidebar(stdscr, y, x, h, w, state: AppState) -> None:
+# Sidebar key hints, with the key column already padded to six cells.
+KEY_HINTS = tuple(
+    f"{key:<6}{desc}"
+    for key, desc in (
+        ("space", "play/pause"),
+        ("n/p", "next/prev"),
+        ("+/-", "volume"),
+        ("/", "search"),
+    )
+)
+
+
+def draw_sidebar(stdscr, y, x, h, w, state: AppState, attrs: FrameAttrs) -> None:
     """Right sidebar: Up Next track + playing from + key hints (no headers)."""
     if h < 2 or w < 12:
         return
-    dim = curses.color_pair(C_DIM) | curses.A_DIM
-    acc = curses.color_pair(accent_pair(state))
-    bright = curses.color_pair(C_BRIGHT) | curses.A_BOLD
+    dim = attrs.dim
+    acc = attrs.acc
+    bright = attrs.bright
     cx = x + 2
     tw = w - 3
     line = y
@@ -972,34 +1381,42 @@ def draw_sidebar(stdscr, y, x, h, w, state: AppState) -> None:
         return
 
     # Key hints (no "Keys" header)
-    hints = [
-        ("space", "play/pause"),
-        ("n/p", "next/prev"),
-        ("+/-", "volume"),
-        ("/", "search"),
-    ]
-    for key, desc in hints:
+    for hint in KEY_HINTS:
         if line >= y + h:
             break
-        safe_addstr(stdscr, line, cx, f"{key:<6}", acc | curses.A_BOLD)
-        safe_addstr(stdscr, line, cx + 6, desc[:tw - 6], dim)
+        safe_addstr(stdscr, line, cx, hint[:tw], dim)
+        safe_chgat(stdscr, line, cx, min(6, tw), acc | curses.A_BOLD)
         line += 1
 
 
 def get_filtered_playlists(state: AppState) -> List[str]:
     if not state.search_active or not state.search_query:
         return state.playlists
-    query = state.search_query.lower()
-    return [p for p in state.playlists if query in p.lower()]
+    # Drawing and key handling both ask for this several times per event;
+    # rescan only when the playlists or the query actually change.
+    key = (state.playlists_version, state.search_folded)
+    if state.filtered_key != key:
+        version, query = key
+        old_version, old_query = state.filtered_key
+        if version == old_version and old_query and query.startswith(old_query):
+            # Typing another character can only narrow the previous matches.
+            names, folded = state.filtered_cache, state.filtered_folded
+        else:
+            names, folded = state.playlists, state.playlists_folded
+        matches = [(p, f) for p, f in zip(names, folded) if query in f]
+        state.filtered_cache = [p for p, _ in matches]
+        state.filtered_folded = [f for _, f in matches]
+        state.filtered_key = key
+    return state.filtered_cache
 
 
-def draw_playlists(stdscr, y, x, h, w, state: AppState) -> None:
+def draw_playlists(stdscr, y, x, h, w, state: AppState, attrs: FrameAttrs) -> None:
     if h < 1 or w < 10:
         return
     filtered = get_filtered_playlists(state)
-    dim = curses.color_pair(C_DIM) | curses.A_DIM
-    acc = curses.color_pair(accent_pair(state))
-    sel_cp = curses.color_pair(selected_pair(state))
+    dim = attrs.dim
+    acc = attrs.acc
+    sel_attr = attrs.selected | curses.A_BOLD
     cx = x + 2
     tw = w - 4  # leave room for scroll bar
 
@@ -1022,225 +1439,411 @@ def draw_playlists(stdscr, y, x, h, w, state: AppState) -> None:
     start = max(0, sel_idx - max_rows + 1)
     visible = filtered[start: start + max_rows]
 
-    for idx, name in enumerate(visible):
-        row = content_y + idx
-        if row >= y + h:
-            break
-        abs_idx = start + idx
-        is_playing = (name == state.current_playlist_name and state.current_playlist_name)
-
-        if abs_idx == sel_idx:
-            indicator = "\u25b8 " if not USE_ASCII else "> "
-            row_text = f"{indicator}{name}"
-            padded = row_text[:tw].ljust(tw)
-            safe_addstr(stdscr, row, cx, padded, sel_cp | curses.A_BOLD)
-        elif is_playing:
-            icon = "\u266b " if not USE_ASCII else "# "
-            safe_addstr(stdscr, row, cx, (icon + name)[:tw], acc)
+    # Rows stay inside the panel, which draw_ui already fitted to the screen,
+    # so they skip safe_addstr's bounds checks and let addnstr cap the width.
+    addnstr = stdscr.addnstr
+    playing_name = state.current_playlist_name
+    sel_row = content_y + sel_idx - start
+    pad = blank(tw)
+    for row, name in enumerate(visible, content_y):
+        if row == sel_row:
+            text, attr = INDICATOR_SEL + name + pad, sel_attr
+        elif playing_name and name == playing_name:
+            text, attr = INDICATOR_PLAY + name, acc
         else:
-            safe_addstr(stdscr, row, cx, ("  " + name)[:tw])
+            text, attr = "  " + name, 0
+        try:
+            addnstr(row, cx, text, tw, attr)
+        except curses.error:
+            pass
 
     # Thin scroll indicator bar
     if len(filtered) > max_rows and h > 2:
+        # More rows than fit, so the track is max_rows tall and span >= 1.
+        # Only the thumb is drawn; the rest of the track is left blank.
         track_x = x + w - 1
-        track_h = max_rows
-        if track_h > 0 and len(filtered) > 0:
-            thumb_h = max(1, track_h * max_rows // len(filtered))
-            span = max(1, len(filtered) - max_rows)
-            thumb_pos = int((track_h - thumb_h) * start / span) if span > 0 else 0
-            scroll_char = BOX_V
-            for i in range(track_h):
-                row = content_y + i
-                if row >= y + h:
-                    break
-                if thumb_pos <= i < thumb_pos + thumb_h:
-                    safe_addstr(stdscr, row, track_x, scroll_char, acc | curses.A_DIM)
+        thumb_h = max(1, max_rows * max_rows // len(filtered))
+        span = len(filtered) - max_rows
+        thumb_top = content_y + (max_rows - thumb_h) * start // span
+        thumb_attr = acc | curses.A_DIM
+        for row in range(thumb_top, min(thumb_top + thumb_h, y + h)):
+            safe_addstr(stdscr, row, track_x, BOX_V, thumb_attr)
 
 
-def draw_status_bar(stdscr, y, width, state: AppState) -> None:
+STATUS_INDICATORS = (
+    {"PLAYING": ">", "PAUSED": "=", "STOPPED": "."}
+    if USE_ASCII
+    else {"PLAYING": "▶", "PAUSED": "⏸", "STOPPED": "·"}
+)
+
+
+def draw_status_bar(stdscr, y, width, state: AppState, attrs: FrameAttrs) -> None:
     if y < 0 or width <= 0:
         return
-    status = state.status or "Ready"
-    ps = state.now_playing.state.upper() if state.now_playing.state else ""
-    if USE_ASCII:
-        ind = {"PLAYING": ">", "PAUSED": "=", "STOPPED": "."}.get(ps, " ")
-    else:
-        ind = {"PLAYING": "▶", "PAUSED": "⏸", "STOPPED": "·"}.get(ps, " ")
-    line = f" {ind}  {status}"
-    bar_attr = curses.color_pair(C_STATUS)
-    safe_addstr(stdscr, y, 0, " " * (width - 1), bar_attr)
-    safe_addstr(stdscr, y, 0, line, bar_attr)
-    # Right side: ? for help
+    line = status_line(width, state.now_playing.state, state.status or "Ready")
+    safe_addstr(stdscr, y, 0, line, attrs.status)
+
+
+# The status text and player state change far less often than frames are
+# drawn, so the padded bar is reused until one of them (or the width) does.
+@lru_cache(maxsize=32)
+def status_line(width: int, player_state: str, status: str) -> str:
+    line = f" {STATUS_INDICATORS.get(player_state, ' ')}  {status}"
+    # Right side: ? for help. The bar is one padded string, one addstr.
     hint = "? help "
     if width > len(line) + len(hint) + 2:
-        safe_addstr(stdscr, y, width - len(hint) - 1, hint, bar_attr)
-
-
-def draw_help_overlay(stdscr, height, width, state: AppState) -> None:
-    acc = curses.color_pair(accent_pair(state))
-    dim = curses.color_pair(C_DIM) | curses.A_DIM
-    bright = curses.color_pair(C_BRIGHT) | curses.A_BOLD
-
-    sections = [
-        ("PLAYBACK", [
-            ("space", "Play / Pause"),
-            ("n  p", "Next / Previous"),
-            ("o  a  s", "Play / Pause / Stop"),
-            ("x", "Shuffle"),
-            ("v", "Repeat"),
-        ]),
-        ("AUDIO", [
-            ("+ / -", "Volume up / down"),
-            ("m", "Mute / Unmute"),
-            ("< / >", "Seek back / forward"),
-        ]),
-        ("NAVIGATION", [
-            ("j  k", "Move down / up"),
-            ("enter", "Play playlist"),
-            ("g  G", "Top / Bottom"),
-            ("/", "Search"),
-            ("esc", "Cancel search"),
-        ]),
-        ("OTHER", [
-            ("r", "Refresh"),
-            ("u", "Dump UI tree"),
-            ("?", "Close help"),
-            ("q", "Quit"),
-        ]),
-    ]
-
-    # Calculate size
-    total_lines = 0
-    for title, keys in sections:
-        total_lines += 1 + len(keys) + 1  # title + keys + gap
-    total_lines -= 1  # no trailing gap
-
-    box_w = min(48, width - 4)
-    box_h = min(total_lines + 4, height - 2)
-    sy = max(0, (height - box_h) // 2)
-    sx = max(0, (width - box_w) // 2)
-
-    # Clear area
-    for row in range(box_h):
-        if sy + row < height:
-            safe_addstr(stdscr, sy + row, sx, " " * box_w)
+        return line.ljust(width - len(hint) - 1) + hint
+    return line.ljust(width - 1)
+
+
+HELP_SECTIONS = (
+    ("PLAYBACK", (
+        ("space", "Play / Pause"),
+        ("n  p", "Next / Previous"),
+        ("o  a  s", "Play / Pause / Stop"),
+        ("x", "Shuffle"),
+        ("v", "Repeat"),
+    )),
+    ("AUDIO", (
+        ("+ / -", "Volume up / down"),
+        ("m", "Mute / Unmute"),
+        ("< / >", "Seek back / forward"),
+    )),
+    ("NAVIGATION", (
+        ("j  k", "Move down / up"),
+        ("enter", "Play playlist"),
+        ("g  G", "Top / Bottom"),
+        ("/", "Search"),
+        ("esc", "Cancel search"),
+    )),
+    ("OTHER", (
+        ("r", "Refresh"),
+        ("u", "Dump UI tree"),
+        ("?", "Close help"),
+        ("q", "Quit"),
+    )),
+)
+HELP_KEY_WIDTH = 12
+
+
+def build_help_lines() -> List[Tuple[int, str, bool]]:
+    """Flatten HELP_SECTIONS into (row offset, text, is_title) below the box title."""
+    lines = []
+    dy = 0
+    for title, keys in HELP_SECTIONS:
+        lines.append((dy, title, True))
+        dy += 1
+        for key_str, desc in keys:
+            lines.append((dy, f"{key_str:<{HELP_KEY_WIDTH}}{desc}", False))
+            dy += 1
+        dy += 1  # gap between sections
+    return lines
+
+
+# The help text never changes, so its layout is flattened once at import.
+HELP_LINES = build_help_lines()
+HELP_BOX_H = HELP_LINES[-1][0] + 1 + 4  # content, plus title and rule rows
+
+
+def draw_help_overlay(height, width, state: AppState, attrs: FrameAttrs) -> None:
+    """Composite the help box over the frame stdscr just queued for output."""
+    key = (height, width, attrs)
+    if state.help_win is None or state.help_win_key != key:
+        box_w = min(48, width - 4)
+        box_h = min(HELP_BOX_H, height - 2)
+        sy = max(0, (height - box_h) // 2)
+        sx = max(0, (width - box_w) // 2)
+        state.help_win = curses.newwin(box_h, box_w, sy, sx)
+        state.help_win_key = key
+        paint_help(state.help_win, box_h, box_w, attrs)
+    # stdscr.noutrefresh() just rewrote the cells under the box, so mark the
+    # window touched for noutrefresh to copy it over them again.
+    state.help_win.touchwin()
+    state.help_win.noutrefresh()
+
+
+def paint_help(win, box_h: int, box_w: int, attrs: FrameAttrs) -> None:
+    acc = attrs.acc
+    dim = attrs.dim
+    bright = attrs.bright
 
     # Top/bottom accent lines
-    line_char = "-" if USE_ASCII else "─"
-    safe_addstr(stdscr, sy, sx, line_char * box_w, acc | curses.A_DIM)
-    if sy + box_h - 1 < height:
-        safe_addstr(stdscr, sy + box_h - 1, sx, line_char * box_w, acc | curses.A_DIM)
+    rule = BOX_H * box_w
+    try:
+        win.addstr(0, 0, rule, acc | curses.A_DIM)
+        # Writing the window's last cell leaves the cursor nowhere to go, so
+        # addstr reports an error after drawing it.
+        win.addstr(box_h - 1, 0, rule, acc | curses.A_DIM)
+    except curses.error:
+        pass
 
     # Title
-    safe_addstr(stdscr, sy + 1, sx + 2, "Keyboard Shortcuts", bright)
-
-    # Content
-    line = sy + 3
-    cx = sx + 2
-    kw = 12
-    for sec_idx, (title, keys) in enumerate(sections):
-        if line >= sy + box_h - 1:
-            break
-        safe_addstr(stdscr, line, cx, title, acc | curses.A_BOLD)
-        line += 1
-        for key_str, desc in keys:
-            if line >= sy + box_h - 1:
+    cx = 2
+    text_w = box_w - 4
+    title_attr = acc | curses.A_BOLD
+    try:
+        win.addnstr(1, cx, "Keyboard Shortcuts", text_w + 1, bright)
+
+        # Content
+        for dy, text, is_title in HELP_LINES:
+            line = 3 + dy
+            if line >= box_h - 1:
                 break
-            safe_addstr(stdscr, line, cx + 1, f"{key_str:<{kw}}", bright)
-            safe_addstr(stdscr, line, cx + 1 + kw, desc[:box_w - kw - 4], dim)
-            line += 1
-        line += 1  # gap between sections
+            if is_title:
+                win.addnstr(line, cx, text, text_w + 1, title_attr)
+            else:
+                win.addnstr(line, cx + 1, text, text_w, dim)
+                win.chgat(line, cx + 1, min(HELP_KEY_WIDTH, text_w), bright)
+    except curses.error:
+        pass
 
 
 # ── Layout ───────────────────────────────────────────────────────────
 
 
-def draw_ui(stdscr, state: AppState) -> None:
+def is_animated(state: AppState) -> bool:
+    """The EQ, the pause blink and the search cursor change several times a second."""
+    return state.search_active or (
+        not USE_ASCII and state.now_playing.state in ("PLAYING", "PAUSED")
+    )
+
+
+def next_redraw_wait(state: AppState, now: float) -> float:
+    """Seconds until the frame could look different without any new input."""
+    wait = IDLE_REDRAW_WAIT
+    if is_animated(state):
+        wait = ANIMATION_STEP - (now % ANIMATION_STEP)
+    info = state.now_playing
+    if info.state == "PLAYING":
+        position = current_position(state, now)
+        if position < info.duration:
+            wait = min(wait, 1.0 - (position % 1.0))
+    if state.status and state.status != "Ready" and state.status_set_time > 0:
+        clear_in = state.status_set_time + STATUS_CLEAR_SECONDS - now
+        if clear_in > 0:
+            wait = min(wait, clear_in)
+    return max(0.01, wait)
+
+
+def frame_key(stdscr, state: AppState, now: float) -> tuple:
+    """Everything the frame depends on; an unchanged key means an identical frame."""
+    info = state.now_playing
+    up = state.up_next
+    animated = is_animated(state)
+    return (
+        stdscr.getmaxyx(),
+        info.name, info.artist, info.album, info.state, info.duration,
+        int(current_position(state, now)),
+        state.volume, state.shuffle_enabled, state.repeat_mode,
+        state.current_playlist_name, up.status, up.name, up.artist,
+        state.playlists_version, state.playlists_loaded,
+        state.selected_index, state.search_active, state.search_query,
+        state.show_help, state.status,
+        int(now / ANIMATION_STEP) if animated else 0,
+    )
+
+
+PAD_LEFT = 2
+PAD_RIGHT = 2
+
+
+@dataclass(frozen=True)
+class Layout:
+    """Panel geometry for one terminal size."""
+
+    content_w: int
+    usable: bool
+    np_top: int
+    np_h: int
+    panel_top: int
+    panel_h: int
+    wide: bool
+    left_x: int
+    left_w: int
+    right_x: int
+    right_w: int
+
+
+# The geometry only depends on the terminal size; clear_layout_caches()
+# drops it on KEY_RESIZE.
+@lru_cache(maxsize=4)
+def compute_layout(height: int, width: int) -> Layout:
+    content_w = width - PAD_LEFT - PAD_RIGHT
+    np_top = 3
+    np_h = 6
+    panel_top = np_top + np_h + 1
+    panel_bot = height - 2
+    left_w = content_w // 2
+    return Layout(
+        content_w=content_w,
+        usable=height >= 10 and content_w >= 20,
+        np_top=np_top,
+        np_h=np_h,
+        panel_top=panel_top,
+        panel_h=panel_bot - panel_top + 1,
+        wide=width >= 55,
+        left_x=PAD_LEFT,
+        left_w=left_w,
+        right_x=PAD_LEFT + left_w,
+        right_w=content_w - left_w,
+    )
+
+
+def draw_ui(stdscr, state: AppState, now: float) -> None:
+    # erase() only clears curses' virtual screen. doupdate() diffs it against
+    # what the terminal shows and sends just the changed cells, so the frame
+    # is redrawn from scratch without repainting the terminal.
     stdscr.erase()
+    attrs = frame_attrs(state)
     height, width = stdscr.getmaxyx()
+    screen_size[:] = (height, width)
 
-    PAD_LEFT = 2
-    PAD_RIGHT = 2
-    content_w = width - PAD_LEFT - PAD_RIGHT
+    layout = compute_layout(height, width)
 
     # Row 0: Header bar (full width)
-    draw_header(stdscr, width, state)
+    draw_header(stdscr, width, state, attrs, now)
 
     # Last row: Status bar
-    status_row = height - 1
-    draw_status_bar(stdscr, status_row, width, state)
+    draw_status_bar(stdscr, height - 1, width, state, attrs)
 
-    if height < 10 or content_w < 20:
-        stdscr.refresh()
+    if not layout.usable:
+        stdscr.noutrefresh()
         return
 
     # Rows 1-2: breathing room (blank)
     # Rows 3-8: Now playing (6 rows)
-    np_top = 3
-    np_h = 6
-    draw_now_playing(stdscr, np_top, PAD_LEFT, np_h, content_w, state)
+    draw_now_playing(stdscr, layout.np_top, PAD_LEFT, layout.np_h, layout.content_w, state, attrs, now)
 
     # Row 9: blank spacer
     # Rows 10..height-2: bordered panels
-    panel_top = np_top + np_h + 1
-    panel_bot = height - 2
-    panel_h = panel_bot - panel_top + 1
-
-    if panel_h < 4:
-        stdscr.refresh()
+    if layout.panel_h < 4:
+        stdscr.noutrefresh()
         return
 
     # Build panel titles
     filtered = get_filtered_playlists(state)
     if state.search_active:
-        cursor = "\u258f" if not USE_ASCII else "|"
-        blink = cursor if int(time.time() * 2) % 2 == 0 else " "
+        blink = SEARCH_CURSOR if int(now * 2) % 2 == 0 else " "
         left_title = f"Search: {state.search_query}{blink}"
     else:
         left_title = f"Library {len(filtered)}"
     right_title = "Up Next"
 
-    dim = curses.color_pair(C_DIM) | curses.A_DIM
-    acc = curses.color_pair(accent_pair(state))
+    dim = attrs.dim
+    acc = attrs.acc
+    panel_top, panel_h = layout.panel_top, layout.panel_h
 
-    if width >= 55:
+    if layout.wide:
         # Wide mode: side-by-side bordered panels
-        left_w = content_w // 2
-        right_w = content_w - left_w
-        left_x = PAD_LEFT
-        right_x = PAD_LEFT + left_w
+        left_x, left_w = layout.left_x, layout.left_w
+        right_x, right_w = layout.right_x, layout.right_w
 
-        draw_panel_border(stdscr, panel_top, left_x, panel_h, left_w, left_title, acc)
-        draw_panel_border(stdscr, panel_top, right_x, panel_h, right_w, right_title, dim)
+        draw_panel_border(stdscr, panel_top, left_x, panel_h, left_w, attrs, left_title, acc)
+        draw_panel_border(stdscr, panel_top, right_x, panel_h, right_w, attrs, right_title, dim)
 
         # Inner content (inset 1 from border on all sides)
         inner_top = panel_top + 1
         inner_h = panel_h - 2
         if inner_h > 0:
-            draw_playlists(stdscr, inner_top, left_x + 1, inner_h, left_w - 2, state)
-            draw_sidebar(stdscr, inner_top, right_x + 1, inner_h, right_w - 2, state)
+            draw_playlists(stdscr, inner_top, left_x + 1, inner_h, left_w - 2, state, attrs)
+            draw_sidebar(stdscr, inner_top, right_x + 1, inner_h, right_w - 2, state, attrs)
     else:
         # Narrow mode: no borders, stack vertically
         safe_addstr(stdscr, panel_top, PAD_LEFT + 1, left_title, dim)
         pl_top = panel_top + 1
         pl_h = panel_h - 1
         if pl_h > 0:
-            draw_playlists(stdscr, pl_top, PAD_LEFT, pl_h, content_w, state)
+            draw_playlists(stdscr, pl_top, PAD_LEFT, pl_h, layout.content_w, state, attrs)
 
-    # Help overlay
-    if state.show_help:
-        draw_help_overlay(stdscr, height, width, state)
+    stdscr.noutrefresh()
 
-    stdscr.refresh()
+    # Help overlay: its own window, painted when opened and re-composited
+    # on top of each frame.
+    if state.show_help:
+        draw_help_overlay(height, width, state, attrs)
+    elif state.help_win is not None:
+        state.help_win = None
 
 
 # ── Input handling ───────────────────────────────────────────────────
 
 
+# Bursts of these (key repeat on +/- or </>) are merged into one call with
+# the summed delta instead of one AppleScript round trip per keypress.
+COALESCED_ACTIONS = (set_volume, seek_track)
+
+# These have no delta to merge, so a held key would skip or toggle once per
+# repeat. Repeats closer together than ACTION_DEBOUNCE_SECONDS are dropped.
+DEBOUNCED_ACTIONS = (
+    play_pause, next_track, previous_track,
+    toggle_shuffle, toggle_repeat, toggle_mute,
+)
+
+
+def spawn_action(state: AppState, target, *args) -> None:
+    """Queue an action for the action worker; it wakes the poller when done."""
+    if not state.music_running:
+        set_status(state, "Music app is not running.")
+        # The poller may be in its long not-running wait; have it re-probe
+        # now so keys work again as soon as Music is back.
+        state.music_running_checked_at = 0.0
+        state.wake_event.set()
+        return
+    now = time.monotonic()
+    # Any key counts as recent input for the poller, even a dropped repeat.
+    state.last_action_time = now
+    if target in DEBOUNCED_ACTIONS:
+        if now - state.debounce_times.get(target, 0.0) < ACTION_DEBOUNCE_SECONDS:
+            return
+        state.debounce_times[target] = now
+    state.action_queue.put((target, args))
+
+
+def action_worker(state: AppState) -> None:
+    """Run queued actions one at a time, off the UI thread, until None arrives."""
+    # A coalescing scan may pull the None shutdown sentinel, so "nothing
+    # held back" needs a marker of its own.
+    no_pending = object()
+    pending = no_pending
+    while True:
+        item = pending if pending is not no_pending else state.action_queue.get()
+        pending = no_pending
+        if item is None:
+            return
+        target, args = item
+        if target in COALESCED_ACTIONS:
+            delta = args[0]
+            while True:
+                try:
+                    nxt = state.action_queue.get_nowait()
+                except queue.Empty:
+                    break
+                if nxt is None or nxt[0] is not target:
+                    pending = nxt
+                    break
+                delta += nxt[1][0]
+            if not delta:
+                continue
+            args = (delta,)
+        try:
+            target(state, *args)
+        except Exception:
+            set_status(state, "Action failed.")
+        finally:
+            state.wake_event.set()
+            request_redraw(state)
+
+
+def set_search_query(state: AppState, query: str) -> None:
+    """Update the query and the casefolded copy the filter matches against."""
+    state.search_query = query
+    state.search_folded = query.casefold()
+
+
 def handle_search_key(state: AppState, key: int) -> bool:
     if key == 27:  # Esc
         state.search_active = False
-        state.search_query = ""
+        set_search_query(state, "")
         return True
     if key in (curses.KEY_ENTER, 10, 13):
         state.search_active = False
@@ -1248,16 +1851,13 @@ def handle_search_key(state: AppState, key: int) -> bool:
         if filtered:
             sel = min(state.selected_index, len(filtered) - 1)
             real_name = filtered[sel]
-            try:
-                state.selected_index = state.playlists.index(real_name)
-            except ValueError:
-                pass
-            threading.Thread(target=play_selected_playlist, args=(state,), daemon=True).start()
-        state.search_query = ""
+            state.selected_index = state.playlist_index.get(real_name, state.selected_index)
+            spawn_action(state, play_selected_playlist)
+        set_search_query(state, "")
         return True
     if key in (curses.KEY_BACKSPACE, 127, 8):
         if state.search_query:
-            state.search_query = state.search_query[:-1]
+            set_search_query(state, state.search_query[:-1])
         return True
     if key == curses.KEY_DOWN:
         filtered = get_filtered_playlists(state)
@@ -1269,7 +1869,7 @@ def handle_search_key(state: AppState, key: int) -> bool:
             state.selected_index -= 1
         return True
     if 32 <= key <= 126:
-        state.search_query += chr(key)
+        set_search_query(state, state.search_query + chr(key))
         filtered = get_filtered_playlists(state)
         if state.selected_index >= len(filtered):
             state.selected_index = 0
@@ -1277,6 +1877,45 @@ def handle_search_key(state: AppState, key: int) -> bool:
     return True
 
 
+# Keys that only queue a player action, looked up before the navigation keys.
+ACTION_KEYS = {
+    curses.KEY_ENTER: (play_selected_playlist,),
+    10: (play_selected_playlist,),
+    13: (play_selected_playlist,),
+    ord(" "): (play_pause,),
+    ord("n"): (next_track,),
+    ord("N"): (next_track,),
+    ord("p"): (previous_track,),
+    ord("P"): (previous_track,),
+    ord("o"): (play_track,),
+    ord("O"): (play_track,),
+    ord("a"): (pause_track,),
+    ord("A"): (pause_track,),
+    ord("s"): (stop_track,),
+    ord("S"): (stop_track,),
+    ord("x"): (toggle_shuffle,),
+    ord("X"): (toggle_shuffle,),
+    ord("v"): (toggle_repeat,),
+    ord("+"): (set_volume, 5),
+    ord("="): (set_volume, 5),
+    ord("-"): (set_volume, -5),
+    ord("m"): (toggle_mute,),
+    ord("M"): (toggle_mute,),
+    curses.KEY_RIGHT: (seek_track, 10.0),
+    curses.KEY_LEFT: (seek_track, -10.0),
+}
+
+# Clickable now-playing controls, keyed by the names draw_now_playing records.
+CONTROL_ACTIONS = {
+    "Prev": previous_track,
+    "Next": next_track,
+    "Play": play_track,
+    "Pause": pause_track,
+    "Stop": stop_track,
+    "Shuffle": toggle_shuffle,
+}
+
+
 def handle_key(stdscr, state: AppState, key: int) -> bool:
     if state.search_active:
         return handle_search_key(state, key)
@@ -1290,105 +1929,109 @@ def handle_key(stdscr, state: AppState, key: int) -> bool:
         state.show_help = False
         return True
 
-    if key in (curses.KEY_DOWN, ord("j")):
-        filtered = get_filtered_playlists(state)
-        if state.selected_index < len(filtered) - 1:
-            state.selected_index += 1
-    elif key in (curses.KEY_UP, ord("k")):
-        if state.selected_index > 0:
-            state.selected_index -= 1
-    elif key == ord("g"):
-        state.selected_index = 0
-    elif key == ord("G"):
+    action = ACTION_KEYS.get(key)
+    if action is not None:
+        spawn_action(state, *action)
+        return True
+
+    handler = KEY_HANDLERS.get(key)
+    if handler is not None:
+        handler(state)
+    return True
+
+
+def move_down(state: AppState) -> None:
+    filtered = get_filtered_playlists(state)
+    if state.selected_index < len(filtered) - 1:
+        state.selected_index += 1
+
+
+def move_up(state: AppState) -> None:
+    if state.selected_index > 0:
+        state.selected_index -= 1
+
+
+def move_top(state: AppState) -> None:
+    state.selected_index = 0
+
+
+def move_bottom(state: AppState) -> None:
+    filtered = get_filtered_playlists(state)
+    if filtered:
+        state.selected_index = len(filtered) - 1
+
+
+def page_up(state: AppState) -> None:
+    _, _, h, _ = state.playlist_box_info
+    page = max(1, h - 4)
+    state.selected_index = max(0, state.selected_index - page)
+
+
+def page_down(state: AppState) -> None:
+    _, _, h, _ = state.playlist_box_info
+    page = max(1, h - 4)
+    filtered = get_filtered_playlists(state)
+    state.selected_index = min(len(filtered) - 1, state.selected_index + page)
+
+
+def start_search(state: AppState) -> None:
+    state.search_active = True
+    set_search_query(state, "")
+
+
+def refresh_all(state: AppState) -> None:
+    set_status(state, "Refreshing...")
+    state.playlists_fingerprint = ""
+    state.pool.submit(fetch_all, state)
+
+
+def handle_mouse(state: AppState) -> None:
+    try:
+        _, mx, my, _, mouse_state = curses.getmouse()
+    except curses.error:
+        return
+    if not mouse_state & curses.BUTTON1_CLICKED:
+        return
+    for name, (cy, cx, cw) in state.controls.items():
+        if my == cy and cx <= mx < cx + cw:
+            if name in CONTROL_ACTIONS:
+                spawn_action(state, CONTROL_ACTIONS[name])
+            return
+    py, px, ph, pw = state.playlist_box_info
+    if py <= my < py + ph and px < mx < px + pw - 1:
         filtered = get_filtered_playlists(state)
         if filtered:
-            state.selected_index = len(filtered) - 1
-    elif key in (curses.KEY_PPAGE,):
-        _, _, h, _ = state.playlist_box_info
-        page = max(1, h - 4)
-        state.selected_index = max(0, state.selected_index - page)
-    elif key in (curses.KEY_NPAGE,):
-        _, _, h, _ = state.playlist_box_info
-        page = max(1, h - 4)
-        filtered = get_filtered_playlists(state)
-        state.selected_index = min(len(filtered) - 1, state.selected_index + page)
-    elif key in (curses.KEY_ENTER, 10, 13):
-        threading.Thread(target=play_selected_playlist, args=(state,), daemon=True).start()
-    elif key == ord(" "):
-        threading.Thread(target=play_pause, args=(state,), daemon=True).start()
-    elif key in (ord("n"), ord("N")):
-        threading.Thread(target=next_track, args=(state,), daemon=True).start()
-    elif key in (ord("p"), ord("P")):
-        threading.Thread(target=previous_track, args=(state,), daemon=True).start()
-    elif key in (ord("o"), ord("O")):
-        threading.Thread(target=play_track, args=(state,), daemon=True).start()
-    elif key in (ord("a"), ord("A")):
-        threading.Thread(target=pause_track, args=(state,), daemon=True).start()
-    elif key in (ord("s"), ord("S")):
-        threading.Thread(target=stop_track, args=(state,), daemon=True).start()
-    elif key in (ord("x"), ord("X")):
-        threading.Thread(target=toggle_shuffle, args=(state,), daemon=True).start()
-    elif key == ord("v"):
-        threading.Thread(target=toggle_repeat, args=(state,), daemon=True).start()
-    elif key in (ord("+"), ord("=")):
-        threading.Thread(target=set_volume, args=(state, 5), daemon=True).start()
-    elif key == ord("-"):
-        threading.Thread(target=set_volume, args=(state, -5), daemon=True).start()
-    elif key in (ord("m"), ord("M")):
-        threading.Thread(target=toggle_mute, args=(state,), daemon=True).start()
-    elif key == curses.KEY_RIGHT:
-        threading.Thread(target=seek_track, args=(state, 10.0), daemon=True).start()
-    elif key == curses.KEY_LEFT:
-        threading.Thread(target=seek_track, args=(state, -10.0), daemon=True).start()
-    elif key == ord("/"):
-        state.search_active = True
-        state.search_query = ""
-    elif key in (ord("r"), ord("R")):
-        set_status(state, "Refreshing...")
-        threading.Thread(target=lambda: (fetch_playlists(state), fetch_now_playing(state)), daemon=True).start()
-    elif key in (ord("u"), ord("U")):
-        threading.Thread(target=dump_music_ui, args=(state,), daemon=True).start()
-    elif key == curses.KEY_MOUSE:
-        try:
-            _, mx, my, _, mouse_state = curses.getmouse()
-        except curses.error:
-            return True
-        if mouse_state & curses.BUTTON1_CLICKED:
-            for name, (cy, cx, cw) in state.controls.items():
-                if my == cy and cx <= mx < cx + cw:
-                    if name == "Prev":
-                        threading.Thread(target=previous_track, args=(state,), daemon=True).start()
-                    elif name == "Next":
-                        threading.Thread(target=next_track, args=(state,), daemon=True).start()
-                    elif name == "Play":
-                        threading.Thread(target=play_track, args=(state,), daemon=True).start()
-                    elif name == "Pause":
-                        threading.Thread(target=pause_track, args=(state,), daemon=True).start()
-                    elif name == "Stop":
-                        threading.Thread(target=stop_track, args=(state,), daemon=True).start()
-                    elif name == "Shuffle":
-                        threading.Thread(target=toggle_shuffle, args=(state,), daemon=True).start()
-                    return True
-            py, px, ph, pw = state.playlist_box_info
-            if py <= my < py + ph and px < mx < px + pw - 1:
-                filtered = get_filtered_playlists(state)
-                if filtered:
-                    max_rows = ph
-                    sel_idx = state.selected_index
-                    if sel_idx >= len(filtered):
-                        sel_idx = max(0, len(filtered) - 1)
-                    start = max(0, sel_idx - max_rows + 1)
-                    clicked_idx = start + (my - py)
-                    if 0 <= clicked_idx < len(filtered):
-                        if state.search_active:
-                            real_name = filtered[clicked_idx]
-                            try:
-                                state.selected_index = state.playlists.index(real_name)
-                            except ValueError:
-                                state.selected_index = clicked_idx
-                        else:
-                            state.selected_index = clicked_idx
-    return True
+            max_rows = ph
+            sel_idx = state.selected_index
+            if sel_idx >= len(filtered):
+                sel_idx = max(0, len(filtered) - 1)
+            start = max(0, sel_idx - max_rows + 1)
+            clicked_idx = start + (my - py)
+            if 0 <= clicked_idx < len(filtered):
+                if state.search_active:
+                    real_name = filtered[clicked_idx]
+                    state.selected_index = state.playlist_index.get(real_name, clicked_idx)
+                else:
+                    state.selected_index = clicked_idx
+
+
+# Everything else that reacts to a key outside search mode.
+KEY_HANDLERS = {
+    curses.KEY_DOWN: move_down,
+    ord("j"): move_down,
+    curses.KEY_UP: move_up,
+    ord("k"): move_up,
+    ord("g"): move_top,
+    ord("G"): move_bottom,
+    curses.KEY_PPAGE: page_up,
+    curses.KEY_NPAGE: page_down,
+    ord("/"): start_search,
+    ord("r"): refresh_all,
+    ord("R"): refresh_all,
+    ord("u"): dump_music_ui,
+    ord("U"): dump_music_ui,
+    curses.KEY_MOUSE: handle_mouse,
+}
 
 
 # ── Main ─────────────────────────────────────────────────────────────
@@ -1406,30 +2049,52 @@ def main(stdscr) -> None:
 
     poll_thread = threading.Thread(target=background_poll, args=(state,), daemon=True)
     poll_thread.start()
+    action_thread = threading.Thread(target=action_worker, args=(state,), daemon=True)
+    action_thread.start()
+
+    wake_fd = state.redraw_pipe[0]
+    os.set_blocking(wake_fd, False)
+    os.set_blocking(state.redraw_pipe[1], False)
+    input_fds = [sys.stdin.fileno(), wake_fd]
 
     running = True
     try:
         while running:
-            now = time.time()
-            if state.now_playing.state == "PLAYING" and state.now_playing.duration > 0:
-                if state.last_position_time:
-                    delta = max(0.0, now - state.last_position_time)
-                    state.now_playing.position = min(
-                        state.now_playing.duration, state.now_playing.position + delta
-                    )
-                state.last_position_time = now
+            now = time.monotonic()
             if (state.status and state.status != "Ready"
                     and state.status_set_time > 0
                     and now - state.status_set_time >= STATUS_CLEAR_SECONDS):
                 state.status = "Ready"
-            draw_ui(stdscr, state)
-            key = stdscr.getch()
-            if key != -1:
+            draw_key = frame_key(stdscr, state, now)
+            if draw_key != state.last_draw_key:
+                draw_ui(stdscr, state, now)
+                curses.doupdate()
+                state.last_draw_key = draw_key
+            # Sleep until a key arrives, a worker asks for a redraw, or the
+            # frame is next due to change on its own (clock tick, animation).
+            ready, _, _ = select.select(input_fds, [], [], next_redraw_wait(state, time.monotonic()))
+            if wake_fd in ready:
+                try:
+                    os.read(wake_fd, 4096)
+                except BlockingIOError:
+                    pass
+            while running:
+                key = stdscr.getch()
+                if key == -1:
+                    break
+                if key == curses.KEY_RESIZE:
+                    clear_layout_caches()
                 running = handle_key(stdscr, state, key)
-            time.sleep(0.03)
     finally:
         state.stop_event.set()
+        state.wake_event.set()
+        state.action_queue.put(None)
         poll_thread.join(timeout=1.0)
+        action_thread.join(timeout=1.0)
+        runner.close()
+        ui_runner.close()
+        state.pool.shutdown(wait=False)
+        remove_compiled_scripts()
 
 
 def run() -> None:
@@ -0,0 +1,131 @@
+"""Persistent `osascript -i` child shared by apple_music_tui.py and app.py."""
+
+import queue
+import subprocess
+import threading
+import time
+from typing import List, Optional, Tuple
+
+DEFAULT_TIMEOUT = 5.0
+SENTINEL = "<<END>>"
+# osascript writes `log "<<END>>"` to stderr as the bare text; the (*...*)
+# form is how Script Editor shows it, accepted in case a release wraps it.
+ERR_MARKS = (SENTINEL, f"(*{SENTINEL}*)")
+PROMPTS = (">> ", "?> ")
+
+
+def is_sentinel(line: str) -> bool:
+    # Input lines that print nothing leave their prompts on the next line.
+    while line.startswith(PROMPTS):
+        line = line[3:]
+    return line == SENTINEL
+
+
+class AppleScriptRunner:
+    """One long-lived `osascript -i` child; calls on it run one at a time.
+
+    Each request is a single line, then `log` and a string literal carrying
+    SENTINEL. Their echoes end the call's stderr and stdout, which both feed
+    one queue, so an error always lands on the call that raised it.
+    `evaluate` returns None when the child cannot be started or dies, so
+    callers can fall back to a one-shot run; a timeout is reported like any
+    other AppleScript error.
+    """
+
+    def __init__(self) -> None:
+        self.proc: Optional[subprocess.Popen] = None
+        self.lock = threading.Lock()
+        self.lines: queue.Queue = queue.Queue()
+        self.closed = False
+
+    def start(self) -> bool:
+        if self.closed:
+            return False
+        if self.proc is not None and self.proc.poll() is None:
+            return True
+        try:
+            # close_fds=False lets subprocess use posix_spawn; every fd we
+            # open is non-inheritable (PEP 446), so only 0-2 reach the child.
+            proc = subprocess.Popen(
+                ["/usr/bin/osascript", "-i"],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+                close_fds=False,
+            )
+        except OSError:
+            self.proc = None
+            return False
+        self.proc = proc
+        self.lines = queue.Queue()
+        threading.Thread(target=self._pump, args=(proc.stdout, self.lines, False), daemon=True).start()
+        threading.Thread(target=self._pump, args=(proc.stderr, self.lines, True), daemon=True).start()
+        return True
+
+    @staticmethod
+    def _pump(stream, lines: queue.Queue, is_err: bool) -> None:
+        for line in stream:
+            lines.put((is_err, line.rstrip("\n")))
+        if not is_err:
+            lines.put(None)
+
+    def evaluate(self, line: str, timeout: float = DEFAULT_TIMEOUT) -> Optional[Tuple[str, str, int]]:
+        with self.lock:
+            if not self.start():
+                return None
+            proc = self.proc
+            try:
+                proc.stdin.write(f'{line}\nlog "{SENTINEL}"\n"{SENTINEL}"\n')
+                proc.stdin.flush()
+            except OSError:
+                self.kill()
+                return None
+            out: List[str] = []
+            errors: List[str] = []
+            out_done = err_done = False
+            deadline = time.monotonic() + timeout
+            while not (out_done and err_done):
+                try:
+                    got = self.lines.get(timeout=max(0.0, deadline - time.monotonic()))
+                except queue.Empty:
+                    # A wedged child would stall every later call; start over.
+                    # Music itself is what timed out, so a one-shot retry
+                    # would only wait out the same timeout a second time.
+                    self.kill()
+                    return "", "AppleScript timed out", -1
+                if got is None:
+                    self.kill()
+                    return None
+                is_err, text = got
+                if is_err:
+                    if text.strip() in ERR_MARKS:
+                        err_done = True
+                    else:
+                        errors.append(text)
+                elif is_sentinel(text):
+                    out_done = True
+                else:
+                    # Only the prompt for the line that produced this output.
+                    if text.startswith(PROMPTS):
+                        text = text[3:]
+                    out.append(text)
+            err = "\n".join(errors).strip()
+            return "\n".join(out).strip(), err, 1 if err else 0
+
+    def kill(self) -> None:
+        if self.proc is not None:
+            self.proc.kill()
+            self.proc.wait()
+            self.proc = None
+
+    def close(self) -> None:
+        # Deliberately lock-free: a call in flight holds the lock for up to its
+        # whole timeout. Killing the child ends that call (stdout hits EOF and
+        # it returns None), and `closed` keeps evaluate from starting another.
+        self.closed = True
+        proc = self.proc
+        if proc is not None:
+            proc.kill()
+            proc.wait()
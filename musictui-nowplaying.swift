@@ -0,0 +1,39 @@
+// Push helper for app.py: prints one JSON object per Music player change.
+//
+// Music posts com.apple.Music.playerInfo on every play, pause, stop and track
+// change. Each line carries the same track keys as app.py's JXA poll (name,
+// artist, album, state, duration, position), so the TUI can update without
+// waiting for its next poll.
+//
+// Build: swiftc -O -o musictui-nowplaying musictui-nowplaying.swift
+// Install it anywhere on PATH, or point MUSICTUI_NOWPLAYING_HELPER at it.
+
+import Foundation
+import ScriptingBridge
+
+let music = SBApplication(bundleIdentifier: "com.apple.Music")
+
+func emit(_ info: [AnyHashable: Any]) {
+    let state = (info["Player State"] as? String ?? "").uppercased()
+    var out: [String: Any] = ["state": state]
+    if state != "STOPPED" {
+        out["name"] = info["Name"] as? String ?? ""
+        out["artist"] = info["Artist"] as? String ?? ""
+        out["album"] = info["Album"] as? String ?? ""
+        // "Total Time" is in milliseconds; the notification has no position.
+        out["duration"] = ((info["Total Time"] as? NSNumber)?.doubleValue ?? 0) / 1000
+        out["position"] = (music?.value(forKey: "playerPosition") as? NSNumber)?.doubleValue ?? 0
+    }
+    guard let data = try? JSONSerialization.data(withJSONObject: out),
+          let line = String(data: data, encoding: .utf8) else { return }
+    print(line)
+    fflush(stdout)
+}
+
+DistributedNotificationCenter.default().addObserver(
+    forName: NSNotification.Name("com.apple.Music.playerInfo"), object: nil, queue: nil
+) { note in
+    emit(note.userInfo ?? [:])
+}
+
+RunLoop.main.run()